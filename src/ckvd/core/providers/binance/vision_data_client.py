@@ -45,6 +45,7 @@ from ckvd.core.providers.binance.vision_path_mapper import (
 )
 from ckvd.utils.config import (
     CONCURRENT_DOWNLOADS_LIMIT_1S,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
     HTTP_NOT_FOUND,
     HTTP_OK,
     KLINE_COLUMNS,
@@ -72,6 +73,8 @@ from ckvd.utils.market_constraints import (
     DataProvider,
     MarketType,
     get_market_capabilities,
+    get_minimum_interval,
+    is_interval_supported,
 )
 from ckvd.utils.time_utils import filter_dataframe_by_time
 from ckvd.utils.validation import DataFrameValidator
@@ -222,7 +225,11 @@ class VisionDataClient(DataClientInterface, Generic[T]):
         # Create httpx client with connection pooling to match MAXIMUM_CONCURRENT_DOWNLOADS
         self._client = httpx.Client(
             timeout=30.0,  # Increased timeout for better reliability
-            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
             headers={
                 "User-Agent": (
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -351,14 +358,14 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             # Create the file URL
             # Get proper interval based on market capabilities
             market_type_enum = MarketType.from_string(self.market_type_str)
-            market_caps = get_market_capabilities(market_type_enum)
 
             # Convert string interval to enum for validation
             try:
                 interval_enum = parse_interval(self._interval_str)
 
                 # Validate if interval is supported by market type
-                if interval_enum not in market_caps.supported_intervals:
+                if not is_interval_supported(market_type_enum, interval_enum):
+                    market_caps = get_market_capabilities(market_type_enum)
                     supported_intervals = [i.value for i in market_caps.supported_intervals]
                     error_msg = (
                         f"Interval {self._interval_str} not supported by {market_type_enum.name} market. "
@@ -367,7 +374,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                     logger.error(error_msg)
 
                     # Create a detailed error message with suggestions
-                    min_interval = min(market_caps.supported_intervals, key=lambda x: x.to_seconds())
+                    min_interval = get_minimum_interval(market_type_enum)
                     suggestion = (
                         f"Consider using {min_interval.value} (minimum supported interval) or another supported interval from the list."
                     )
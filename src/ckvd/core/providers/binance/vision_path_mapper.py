@@ -18,6 +18,12 @@ import pendulum
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import ChartType, Interval, MarketType
 
+# Fallback pattern for cache paths outside base_cache_dir
+_LOCAL_CACHE_PATH_PATTERN = re.compile(
+    r".*/(?:data/)?(spot|futures/[^/]+)/daily/([^/]+)/([^/]+)/([^/]+)/([^-]+)-([^-]+)-(\d{4}-\d{2}-\d{2})\.(\w+)$",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class PathComponents:
@@ -34,12 +40,12 @@ class PathComponents:
     @property
     def date_str(self) -> str:
         """Get date string in YYYY-MM-DD format."""
-        return self.date.format("YYYY-MM-DD")
+        return self.date.strftime("%Y-%m-%d")
 
     @property
     def date_filename_str(self) -> str:
         """Get date string for filename in YYYYMMDD format."""
-        return self.date.format("YYYYMMDD")
+        return self.date.strftime("%Y%m%d")
 
     @property
     def safe_symbol(self) -> str:
@@ -112,8 +118,7 @@ class VisionPathMapper:
             return f"{self.base_url}/{rel_str}"
         except ValueError:
             # Fallback for non-standard paths
-            pattern = r".*/(?:data/)?(spot|futures/[^/]+)/daily/([^/]+)/([^/]+)/([^/]+)/([^-]+)-([^-]+)-(\d{4}-\d{2}-\d{2})\.(\w+)$"
-            match = re.search(pattern, str(local_path), re.IGNORECASE)
+            match = _LOCAL_CACHE_PATH_PATTERN.search(str(local_path))
 
             if not match:
                 raise ValueError(f"Can't map to remote URL: {local_path}") from None
@@ -18,6 +18,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 import httpx
+import orjson
 import pandas as pd
 
 from ckvd.utils.config import (
@@ -39,11 +40,45 @@ from ckvd.utils.time_utils import (
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # seconds
 RATE_LIMIT_STATUS = 429
+BOUNDARY_CACHE_MAX_ENTRIES = 256  # Per-validator memo of closed-range boundary lookups
 
 # Deprecation warning message template
 DEPRECATION_WARNING = "{} is deprecated and will be moved to utils.time_utils in a future version. Use utils.time_utils.{} instead."
 
 
+def _build_api_boundaries(
+    first_timestamp_ms: int,
+    last_timestamp_ms: int,
+    record_count: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[str, Any]:
+    """Build the boundary dictionary from the first/last open times and row count.
+
+    Args:
+        first_timestamp_ms: Open time of the first returned kline (milliseconds).
+        last_timestamp_ms: Open time of the last returned kline (milliseconds).
+        record_count: Number of klines returned.
+        start_time: The originally requested start time (UTC-aware).
+        end_time: The originally requested end time (UTC-aware).
+
+    Returns:
+        Dictionary with api_start_time, api_end_time, record_count, matches_request.
+    """
+    api_start_time = datetime.fromtimestamp(first_timestamp_ms / 1000, tz=timezone.utc)
+    api_end_time = datetime.fromtimestamp(last_timestamp_ms / 1000, tz=timezone.utc)
+
+    start_matches = abs((api_start_time - start_time).total_seconds()) < MILLISECOND_TOLERANCE
+    end_within_range = api_end_time <= end_time
+
+    return {
+        "api_start_time": api_start_time,
+        "api_end_time": api_end_time,
+        "record_count": record_count,
+        "matches_request": start_matches and end_within_range,
+    }
+
+
 def _parse_api_response_boundaries(
     api_data: list[list[Any]],
     start_time: datetime,
@@ -69,21 +104,47 @@ def _parse_api_response_boundaries(
             "matches_request": False,
         }
 
-    first_timestamp_ms = api_data[0][0]
-    last_timestamp_ms = api_data[-1][0]
+    return _build_api_boundaries(api_data[0][0], api_data[-1][0], len(api_data), start_time, end_time)
 
-    api_start_time = datetime.fromtimestamp(first_timestamp_ms / 1000, tz=timezone.utc)
-    api_end_time = datetime.fromtimestamp(last_timestamp_ms / 1000, tz=timezone.utc)
 
-    start_matches = abs((api_start_time - start_time).total_seconds()) < MILLISECOND_TOLERANCE
-    end_within_range = api_end_time <= end_time
+def _scan_api_response_boundaries(
+    raw: bytes,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[str, Any] | None:
+    """Extract boundary information from a raw klines body without decoding it.
 
-    return {
-        "api_start_time": api_start_time,
-        "api_end_time": api_end_time,
-        "record_count": len(api_data),
-        "matches_request": start_matches and end_within_range,
-    }
+    Binance kline rows are flat arrays of numbers and numeric strings, so the only
+    ``]`` bytes in the body close a row or the outer array, and each row starts
+    with its open-time integer. This lets the first/last timestamps and the row
+    count be read with C-level bytes scans instead of building up to 1000 Python lists.
+
+    Args:
+        raw: Raw response body from the klines endpoint.
+        start_time: The originally requested start time (UTC-aware).
+        end_time: The originally requested end time (UTC-aware).
+
+    Returns:
+        Same dictionary shape as _parse_api_response_boundaries, or None if the
+        body does not look like a klines array (caller should fall back to a full decode).
+    """
+    body = raw.strip()
+    if not body.startswith(b"[") or not body.endswith(b"]"):
+        return None
+
+    record_count = body.count(b"]") - 1
+    if record_count <= 0:
+        return _parse_api_response_boundaries([], start_time, end_time)
+
+    try:
+        first_row = body.index(b"[", 1)
+        last_row = body.rindex(b"[")
+        first_timestamp_ms = int(body[first_row + 1 : body.index(b",", first_row)])
+        last_timestamp_ms = int(body[last_row + 1 : body.index(b",", last_row)])
+    except ValueError:
+        return None
+
+    return _build_api_boundaries(first_timestamp_ms, last_timestamp_ms, record_count, start_time, end_time)
 
 
 class ApiBoundaryValidator:
@@ -108,6 +169,10 @@ class ApiBoundaryValidator:
         self.market_type = market_type
         # Use httpx client
         self.http_client = create_client(timeout=10.0)
+        # Boundary results for ranges that ended in the past, keyed by
+        # (symbol, interval, start_ms, end_ms). Closed ranges cannot change,
+        # so repeat lookups in the same batch skip the HTTP round trip.
+        self._boundary_cache: dict[tuple[str, str, int, int], dict[str, Any]] = {}
         logger.debug(f"Initialized ApiBoundaryValidator for {market_type} market")
 
     async def __aenter__(self) -> "ApiBoundaryValidator":
@@ -120,8 +185,12 @@ class ApiBoundaryValidator:
         logger.debug("Closed ApiBoundaryValidator HTTP client")
 
     async def close(self):
-        """Close the HTTP client."""
-        await safely_close_client(self.http_client)
+        """Close the HTTP client.
+
+        The client is a synchronous httpx.Client whose close() tears down the
+        connection pool, so it runs in a worker thread to keep the event loop free.
+        """
+        await asyncio.to_thread(safely_close_client, self.http_client)
 
     async def is_valid_time_range(
         self,
@@ -189,13 +258,23 @@ class ApiBoundaryValidator:
         start_time = enforce_utc_timezone(start_time)
         end_time = enforce_utc_timezone(end_time)
 
+        cache_key = (symbol, interval.value, int(start_time.timestamp() * 1000), int(end_time.timestamp() * 1000))
+        cached = self._boundary_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached API boundaries for {symbol} {interval}: {start_time} -> {end_time}")
+            return dict(cached)
+
         try:
-            # Call API to get data for the requested range
-            api_data = await self._call_api(start_time, end_time, interval, limit=1000, symbol=symbol)
+            # Call API to get data for the requested range. Only the first/last
+            # timestamps and the row count are needed, so scan the raw body and
+            # skip decoding the full response unless the body is unexpected.
+            raw = await self._fetch_api_content(start_time, end_time, interval, limit=1000, symbol=symbol)
 
-            result = _parse_api_response_boundaries(api_data, start_time, end_time)
+            result = _scan_api_response_boundaries(raw, start_time, end_time)
+            if result is None:
+                result = _parse_api_response_boundaries(orjson.loads(raw), start_time, end_time)
 
-            if not api_data:
+            if not result["record_count"]:
                 logger.warning("API returned no data for the requested range")
             else:
                 logger.debug(
@@ -203,7 +282,13 @@ class ApiBoundaryValidator:
                     f"Records: {result['record_count']}, Matches Request: {result['matches_request']}"
                 )
 
-            return result
+            if end_time < datetime.now(timezone.utc):
+                if len(self._boundary_cache) >= BOUNDARY_CACHE_MAX_ENTRIES:
+                    # Evict the oldest entry (dicts preserve insertion order)
+                    del self._boundary_cache[next(iter(self._boundary_cache))]
+                self._boundary_cache[cache_key] = result
+
+            return dict(result)
         except (OSError, ConnectionError, TimeoutError, ValueError, KeyError) as e:
             logger.warning(f"Error getting API boundaries: {e}")
             return {
@@ -260,15 +345,14 @@ class ApiBoundaryValidator:
         start_time = enforce_utc_timezone(start_time)
         end_time = enforce_utc_timezone(end_time)
 
-        # First check if DataFrame is empty
-        if df.empty:
-            # If empty, check if API would return any data
-            api_response = await self._call_api(start_time, end_time, interval, symbol=symbol)
-            return len(api_response) == 0
-
-        # Get API boundaries to check time alignment
+        # Get API boundaries to check time alignment (served from the boundary
+        # cache when this range was already looked up in the current batch)
         api_boundaries = await self.get_api_boundaries(start_time, end_time, interval, symbol)
 
+        # An empty DataFrame matches only if the API would return no data either
+        if df.empty:
+            return api_boundaries["record_count"] == 0 and "error" not in api_boundaries
+
         # If API couldn't return valid boundaries, we can't validate
         if not api_boundaries.get("api_start_time"):
             logger.warning("Couldn't determine API boundaries, validation skipped")
@@ -320,6 +404,34 @@ class ApiBoundaryValidator:
         Returns:
             List of klines data
 
+        Raises:
+            Exception: If API call fails after retries
+        """
+        raw = await self._fetch_api_content(start_time, end_time, interval, limit=limit, symbol=symbol)
+        data = orjson.loads(raw)
+        logger.debug(f"API returned {len(data)} records")
+        return data
+
+    async def _fetch_api_content(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval,
+        limit: int = 1000,
+        symbol: str = "BTCUSDT",
+    ) -> bytes:
+        """Call the Binance API with retry logic and return the raw response body.
+
+        Args:
+            start_time: The start time for data retrieval
+            end_time: The end time for data retrieval
+            interval: The data interval
+            limit: Maximum number of records to retrieve
+            symbol: The trading pair symbol
+
+        Returns:
+            Raw JSON response body
+
         Raises:
             Exception: If API call fails after retries
         """
@@ -348,7 +460,9 @@ class ApiBoundaryValidator:
                 # Fetch data from API
                 logger.debug(f"Calling API: {base_url} with params {params}, retry {retries}/{MAX_RETRIES}")
 
-                response = await self.http_client.get(base_url, params=params)
+                # http_client is a synchronous httpx.Client; run the request in a
+                # worker thread so the event loop is not blocked
+                response = await asyncio.to_thread(self.http_client.get, base_url, params=params)
 
                 # Handle response
                 if response.status_code == RATE_LIMIT_STATUS:
@@ -362,14 +476,10 @@ class ApiBoundaryValidator:
                     logger.error(f"API error {response.status_code}: {response.text}")
                     raise RuntimeError(f"API error {response.status_code}: {response.text}")
 
-                # Parse the response data
-                data = response.json()
-
-                logger.debug(f"API returned {len(data)} records")
-                return data
+                return response.content
 
             except (httpx.RequestError, httpx.HTTPStatusError, ValueError, RuntimeError) as e:
-                # Handle retries for network errors, HTTP errors, JSON decode errors
+                # Handle retries for network errors, HTTP errors
                 retries += 1
                 logger.warning(f"API call failed (retry {retries}/{MAX_RETRIES}): {e!s}")
 
@@ -512,7 +622,7 @@ class ApiBoundaryValidator:
         end_ms = int(end_time.timestamp() * 1000)
 
         # Construct API endpoint URL for the specific market type
-        endpoint = get_endpoint_url(self.market_type, ChartType.KLINES, symbol, interval)
+        endpoint = get_endpoint_url(self.market_type, ChartType.KLINES)
 
         params = {
             "symbol": symbol,
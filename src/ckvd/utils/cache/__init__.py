@@ -14,27 +14,47 @@ This subpackage provides centralized cache validation utilities including:
 # Refactoring: Split from cache_validator.py (808 lines) for modularity
 """
 
-from ckvd.utils.cache.errors import (
-    ERROR_TYPES,
-    TEST_SYMBOL,
-    CacheValidationError,
-)
-from ckvd.utils.cache.functions import (
-    safely_read_arrow_file_async,
-    validate_cache_checksum,
-    validate_cache_integrity,
-    validate_cache_metadata,
-    validate_cache_records,
-)
-from ckvd.utils.cache.key_manager import CacheKeyManager
-from ckvd.utils.cache.memory_map import SafeMemoryMap
-from ckvd.utils.cache.options import (
-    AlignmentOptions,
-    CachePathOptions,
-    ValidationOptions,
-)
-from ckvd.utils.cache.validator import CacheValidator
-from ckvd.utils.cache.vision_manager import VisionCacheManager
+import importlib
+from typing import Any
+
+# Lazy imports via __getattr__ (same pattern as ckvd.utils): importing a light
+# submodule such as errors/options/key_manager, or checking file integrity, must
+# not pull in pandas/pyarrow/polars through validator and vision_manager.
+_LAZY_IMPORTS: dict[str, str] = {
+    # From .errors
+    "ERROR_TYPES": ".errors",
+    "TEST_SYMBOL": ".errors",
+    "CacheValidationError": ".errors",
+    # From .functions
+    "safely_read_arrow_file_async": ".functions",
+    "validate_cache_checksum": ".functions",
+    "validate_cache_integrity": ".functions",
+    "validate_cache_metadata": ".functions",
+    "validate_cache_records": ".functions",
+    # From .key_manager
+    "CacheKeyManager": ".key_manager",
+    # From .memory_map
+    "SafeMemoryMap": ".memory_map",
+    # From .options
+    "AlignmentOptions": ".options",
+    "CachePathOptions": ".options",
+    "ValidationOptions": ".options",
+    # From .validator
+    "CacheValidator": ".validator",
+    # From .vision_manager
+    "VisionCacheManager": ".vision_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        val = getattr(module, name)
+        # Cache in module globals for subsequent access (no repeated __getattr__)
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ERROR_TYPES",
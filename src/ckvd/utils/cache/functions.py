@@ -13,15 +13,17 @@ for backward compatibility with existing imports.
 
 from __future__ import annotations
 
+import os
 from datetime import timedelta
 from pathlib import Path
-from typing import Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any
 
 from ckvd.utils.cache.errors import CacheValidationError
 from ckvd.utils.cache.validator import CacheValidator
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 __all__ = [
     "safely_read_arrow_file_async",
     "validate_cache_checksum",
@@ -35,6 +37,7 @@ def validate_cache_integrity(
     cache_path: Path,
     max_age: timedelta | None = None,
     min_size: int | None = None,
+    stat_result: os.stat_result | None = None,
 ) -> CacheValidationError | None:
     """Standalone version of CacheValidator.validate_cache_integrity.
 
@@ -42,11 +45,12 @@ def validate_cache_integrity(
         cache_path: Path to cache file
         max_age: Maximum allowed age of cache
         min_size: Minimum valid file size
+        stat_result: Optional stat of cache_path to reuse instead of a new stat syscall
 
     Returns:
         Error details if validation fails, None if valid
     """
-    return CacheValidator.validate_cache_integrity(cache_path, max_age, min_size)
+    return CacheValidator.validate_cache_integrity(cache_path, max_age, min_size, stat_result)
 
 
 def validate_cache_checksum(cache_path: Path, stored_checksum: str) -> bool:
@@ -64,9 +64,10 @@ class SafeMemoryMap:
             DataFrame or None if read fails
         """
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, lambda: cls._read_arrow_file_impl(path, columns))
-        except (OSError, pa.ArrowInvalid, pa.ArrowIOError, ValueError) as e:
+            loop = asyncio.get_running_loop()
+            # run_in_executor forwards positional args, so no closure is built per read
+            return await loop.run_in_executor(None, cls._read_arrow_file_impl, path, columns)
+        except (OSError, pa.ArrowInvalid, pa.ArrowIOError, ValueError, pl.exceptions.PolarsError) as e:
             logger.error(f"Error reading Arrow file {path}: {e}")
             return None
 
@@ -96,8 +97,12 @@ class SafeMemoryMap:
 
             # Ensure open_time is datetime with UTC timezone
             if "open_time" in df.columns:
+                # Integer open_time is epoch milliseconds, as in the API responses;
+                # a plain cast would read it as microseconds
+                if df["open_time"].dtype.is_integer():
+                    df = df.with_columns(pl.from_epoch("open_time", time_unit="ms").dt.replace_time_zone("UTC"))
                 # Cast to datetime if not already, ensure UTC timezone
-                if df["open_time"].dtype != pl.Datetime:
+                elif df["open_time"].dtype != pl.Datetime:
                     df = df.with_columns(pl.col("open_time").cast(pl.Datetime("us", "UTC")))
                 elif df["open_time"].dtype.time_zone is None:
                     df = df.with_columns(pl.col("open_time").dt.replace_time_zone("UTC"))
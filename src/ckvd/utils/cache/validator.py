@@ -10,29 +10,62 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-import pyarrow as pa
-
 from ckvd.utils.cache.errors import ERROR_TYPES, CacheValidationError
-from ckvd.utils.cache.memory_map import SafeMemoryMap
 from ckvd.utils.cache.options import AlignmentOptions, ValidationOptions
-from ckvd.utils.dataframe_utils import ensure_open_time_as_index
+from ckvd.utils.config import PARALLEL_CHECKSUM_MIN_SIZE, SECONDS_IN_DAY
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval
-from ckvd.utils.validation import DataFrameValidator
-
+from ckvd.utils.validation import (
+    PARALLEL_CHECKSUM_PREFIX,
+    calculate_checksum,
+    calculate_checksum_parallel,
+)
+
+# pandas/pyarrow/polars are imported inside the methods that read or check
+# DataFrames, so integrity, checksum and metadata validation stay import-light
 if TYPE_CHECKING:
+    import pandas as pd
+
     from ckvd.utils.api_boundary_validator import ApiBoundaryValidator
 
 __all__ = [
     "CacheValidator",
 ]
 
+# Cache misses on cold start all share this immutable result instead of
+# allocating an identical error per file
+_CACHE_FILE_MISSING = CacheValidationError(ERROR_TYPES["FILE_SYSTEM"], "Cache file does not exist", True)
+
+# Checksums this process already computed, keyed by (path, size, mtime_ns,
+# chunked format). Rewriting a file changes its size/mtime_ns, so hot cache
+# reads skip re-hashing while any write naturally misses the memo.
+_CHECKSUM_CACHE: dict[tuple[str, int, int, bool], str] = {}
+_CHECKSUM_CACHE_MAX_ENTRIES = 1024
+_CHECKSUM_CACHE_LOCK = threading.Lock()
+
+
+def _remember_checksum(key: tuple[str, int, int, bool], checksum: str) -> None:
+    """Store a checksum in the memo, evicting the oldest entry when full."""
+    with _CHECKSUM_CACHE_LOCK:
+        _CHECKSUM_CACHE.pop(key, None)
+        if len(_CHECKSUM_CACHE) >= _CHECKSUM_CACHE_MAX_ENTRIES:
+            del _CHECKSUM_CACHE[next(iter(_CHECKSUM_CACHE))]
+        _CHECKSUM_CACHE[key] = checksum
+
+
+def _known_checksum(path: Path, stats: os.stat_result, chunked: bool) -> str | None:
+    """Look up a checksum this process already computed for this file version."""
+    return _CHECKSUM_CACHE.get((str(path), stats.st_size, stats.st_mtime_ns, chunked))
+
 
 class CacheValidator:
     """Centralized cache validation utilities.
@@ -46,6 +79,7 @@ class CacheValidator:
     MIN_VALID_FILE_SIZE = 1024  # 1KB minimum for valid data files
     MAX_CACHE_AGE = timedelta(days=30)  # Maximum age before revalidation
     METADATA_UPDATE_INTERVAL = timedelta(minutes=5)
+    REQUIRED_METADATA_FIELDS = frozenset({"checksum", "record_count", "last_updated"})
 
     def __init__(self, api_boundary_validator: ApiBoundaryValidator | None = None) -> None:
         """Initialize the CacheValidator with optional ApiBoundaryValidator.
@@ -61,6 +95,7 @@ class CacheValidator:
         cache_path: Path,
         max_age: timedelta | None = None,
         min_size: int | None = None,
+        stat_result: os.stat_result | None = None,
     ) -> CacheValidationError | None:
         """Validate cache file existence, size, and age.
 
@@ -68,6 +103,8 @@ class CacheValidator:
             cache_path: Path to cache file
             max_age: Maximum allowed age of cache (defaults to MAX_CACHE_AGE)
             min_size: Minimum valid file size (defaults to MIN_VALID_FILE_SIZE)
+            stat_result: Optional stat of cache_path the caller already has
+                (e.g. from os.scandir), reused instead of a new stat syscall
 
         Returns:
             Error details if validation fails, None if valid
@@ -76,10 +113,11 @@ class CacheValidator:
         min_size = min_size or cls.MIN_VALID_FILE_SIZE
 
         try:
-            if not cache_path.exists():
-                return CacheValidationError(ERROR_TYPES["FILE_SYSTEM"], "Cache file does not exist", True)
-
-            stats = cache_path.stat()
+            # Single stat doubles as the existence check (exists() is a stat too)
+            try:
+                stats = stat_result or os.stat(cache_path)
+            except FileNotFoundError:
+                return _CACHE_FILE_MISSING
 
             if stats.st_size < min_size:
                 return CacheValidationError(
@@ -88,11 +126,12 @@ class CacheValidator:
                     True,
                 )
 
-            age = datetime.now(timezone.utc) - datetime.fromtimestamp(stats.st_mtime, timezone.utc)
-            if age > max_age:
+            # Float math on the epoch timestamps avoids building two aware datetimes
+            age_seconds = time.time() - stats.st_mtime
+            if age_seconds > max_age.total_seconds():
                 return CacheValidationError(
                     ERROR_TYPES["CACHE_INVALID"],
-                    f"Cache too old: {age.days} days",
+                    f"Cache too old: {int(age_seconds // SECONDS_IN_DAY)} days",
                     True,
                 )
 
@@ -117,12 +156,96 @@ class CacheValidator:
             True if checksum matches, False otherwise
         """
         try:
-            current_checksum = cls.calculate_checksum(cache_path)
+            chunked = stored_checksum.startswith(PARALLEL_CHECKSUM_PREFIX)
+            stats = os.stat(cache_path)
+            current_checksum = _known_checksum(cache_path, stats, chunked)
+            if current_checksum is None:
+                current_checksum = cls._hash_and_record(cache_path, stats, chunked)
             return current_checksum == stored_checksum
         except (OSError, ValueError) as e:
             logger.error(f"Error validating cache checksum: {e}")
             return False
 
+    @classmethod
+    def validate_cache_checksums(cls, paths_and_sums: dict[Path, str], max_workers: int | None = None) -> dict[Path, bool]:
+        """Validate many cache files against their stored checksums concurrently.
+
+        Files whose checksum is already known for their current fingerprint are
+        resolved on the calling thread; only the rest are hashed in worker
+        threads, where hashlib releases the GIL while digesting the mapped file.
+
+        Args:
+            paths_and_sums: Mapping of cache file path to stored checksum
+            max_workers: Thread pool size (defaults to the executor's default)
+
+        Returns:
+            Mapping of cache file path to True if its checksum matches
+        """
+        results: dict[Path, bool] = {}
+        pending: list[tuple[Path, os.stat_result, bool]] = []
+        for path, stored in paths_and_sums.items():
+            chunked = stored.startswith(PARALLEL_CHECKSUM_PREFIX)
+            try:
+                stats = os.stat(path)
+            except OSError as e:
+                logger.error(f"Error validating cache checksum: {e}")
+                results[path] = False
+                continue
+            known = _known_checksum(path, stats, chunked)
+            if known is None:
+                pending.append((path, stats, chunked))
+            else:
+                results[path] = known == stored
+
+        if pending:
+
+            def hash_pending(item: tuple[Path, os.stat_result, bool]) -> str | None:
+                try:
+                    return cls._hash_and_record(*item)
+                except (OSError, ValueError) as e:
+                    logger.error(f"Error validating cache checksum: {e}")
+                    return None
+
+            if len(pending) == 1:
+                digests = [hash_pending(pending[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    digests = list(pool.map(hash_pending, pending))
+            for (path, _stats, _chunked), digest in zip(pending, digests, strict=True):
+                results[path] = digest is not None and digest == paths_and_sums[path]
+
+        # Report in input order
+        return {path: results[path] for path in paths_and_sums}
+
+    @classmethod
+    def _hash_and_record(cls, cache_path: Path, stats: os.stat_result, chunked: bool) -> str:
+        """Hash a cache file and remember the digest for its current fingerprint.
+
+        Args:
+            cache_path: Path to cache file
+            stats: stat result taken before hashing
+            chunked: Whether to compute the PARALLEL_CHECKSUM_PREFIX format
+
+        Returns:
+            Hexadecimal checksum string
+        """
+        checksum = calculate_checksum_parallel(cache_path) if chunked else cls.calculate_checksum(cache_path)
+        _remember_checksum((str(cache_path), stats.st_size, stats.st_mtime_ns, chunked), checksum)
+        return checksum
+
+    @classmethod
+    async def validate_cache_checksum_async(cls, cache_path: Path, stored_checksum: str) -> bool:
+        """Validate cache file against stored checksum without blocking the event loop.
+
+        Args:
+            cache_path: Path to cache file
+            stored_checksum: Previously stored checksum
+
+        Returns:
+            True if checksum matches, False otherwise
+        """
+        return await asyncio.to_thread(cls.validate_cache_checksum, cache_path, stored_checksum)
+
     @classmethod
     def validate_cache_metadata(
         cls,
@@ -138,13 +261,12 @@ class CacheValidator:
         Returns:
             True if metadata is valid, False otherwise
         """
-        if required_fields is None:
-            required_fields = ["checksum", "record_count", "last_updated"]
-
         if not cache_info:
             return False
 
-        return all(field in cache_info for field in required_fields)
+        required = cls.REQUIRED_METADATA_FIELDS if required_fields is None else frozenset(required_fields)
+        # Set comparison against the keys view runs in C without a generator
+        return required <= cache_info.keys()
 
     @classmethod
     def validate_cache_records(cls, record_count: int | str) -> bool:
@@ -208,6 +330,8 @@ class CacheValidator:
                 True,
             )
 
+        from ckvd.utils.validation import DataFrameValidator
+
         try:
             DataFrameValidator.validate_dataframe(df)
         except ValueError as e:
@@ -250,11 +374,26 @@ class CacheValidator:
         Returns:
             Hexadecimal checksum string
         """
-        h = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        return calculate_checksum(file_path)
+
+    @staticmethod
+    def calculate_cache_checksum(file_path: Path) -> str:
+        """Calculate the checksum to store for a freshly written cache file.
+
+        Files of at least PARALLEL_CHECKSUM_MIN_SIZE bytes get the tagged chunked
+        checksum, hashed across threads; smaller files keep whole-file SHA-256.
+        validate_cache_checksum accepts either format.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hexadecimal checksum string
+        """
+        stats = os.stat(file_path)
+        chunked = stats.st_size >= PARALLEL_CHECKSUM_MIN_SIZE
+        # Seed the memo so the first validation after a save does not re-hash
+        return CacheValidator._hash_and_record(file_path, stats, chunked)
 
     @staticmethod
     def safely_read_arrow_file(file_path: Path, columns: list | None = None) -> pd.DataFrame | None:
@@ -267,26 +406,13 @@ class CacheValidator:
         Returns:
             DataFrame or None if read fails
         """
-        try:
-            with SafeMemoryMap(file_path) as source, pa.ipc.open_file(source) as reader:
-                if columns:
-                    all_cols = reader.schema.names
-                    cols_to_read = (
-                        ["open_time", *list(columns)] if "open_time" in all_cols and "open_time" not in columns else list(columns)
-                    )
-                    table = reader.read_all().select(cols_to_read)
-                else:
-                    table = reader.read_all()
-
-                df = table.to_pandas(
-                    zero_copy_only=False,
-                    date_as_object=False,
-                    use_threads=True,
-                )
+        import polars as pl
 
-                # Use centralized normalization utility
-                return ensure_open_time_as_index(df)
-        except (OSError, pa.ArrowInvalid, pa.ArrowIOError, ValueError) as e:
+        try:
+            return CacheValidator._read_arrow_file_as_pandas(file_path, columns)
+        # pa.ArrowIOError is OSError and pa.ArrowInvalid a ValueError; the Polars
+        # open_time cast raises PolarsError subclasses, which are neither
+        except (OSError, ValueError, pl.exceptions.PolarsError) as e:
             logger.error("Error reading Arrow file %s: %s", file_path, e)
             return None
 
@@ -301,13 +427,43 @@ class CacheValidator:
         Returns:
             DataFrame or None if read fails
         """
-        # SafeMemoryMap returns Polars DataFrame for zero-copy efficiency
-        df_pl = await SafeMemoryMap.safely_read_arrow_file(file_path, columns)
-        if df_pl is None:
+        import polars as pl
+
+        # Read and convert in a worker thread: the pandas conversion costs as
+        # much as the read itself and would otherwise run on the event loop
+        try:
+            return await asyncio.to_thread(CacheValidator._read_arrow_file_as_pandas, file_path, columns)
+        except (OSError, ValueError, pl.exceptions.PolarsError) as e:  # Same errors as safely_read_arrow_file
+            logger.error(f"Error reading Arrow file {file_path}: {e}")
             return None
 
-        # Convert to pandas at API boundary and normalize
-        df = df_pl.to_pandas()
+    @staticmethod
+    def _read_arrow_file_as_pandas(file_path: Path, columns: list | None = None) -> pd.DataFrame:
+        """Read an Arrow file into a pandas DataFrame indexed by open_time.
+
+        Args:
+            file_path: Path to Arrow file
+            columns: Optional list of columns to read
+
+        Returns:
+            DataFrame with open_time as a UTC DatetimeIndex
+        """
+        import pandas as pd
+
+        from ckvd.utils.cache.memory_map import SafeMemoryMap
+        from ckvd.utils.dataframe_utils import ensure_open_time_as_index
+
+        # SafeMemoryMap returns Polars DataFrame for zero-copy efficiency
+        df_pl = SafeMemoryMap._read_arrow_file_impl(file_path, columns)
+
+        if "open_time" not in df_pl.columns:
+            return ensure_open_time_as_index(df_pl.to_pandas())
+
+        # Attach open_time as the index directly instead of converting it as a
+        # column and calling set_index(), which copies every other column
+        index = pd.DatetimeIndex(df_pl.get_column("open_time").to_pandas(), name="open_time")
+        df = df_pl.drop("open_time").to_pandas()
+        df.index = index
         return ensure_open_time_as_index(df)
 
     async def align_cached_data_to_api_boundaries(
@@ -383,6 +539,8 @@ class CacheValidator:
         )
 
         if api_boundaries["record_count"] == 0:
+            import pandas as pd
+
             return pd.DataFrame(index=pd.DatetimeIndex([], name="open_time"))
 
         api_start_time = api_boundaries["api_start_time"]
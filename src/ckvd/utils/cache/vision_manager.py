@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -58,7 +59,8 @@ class VisionCacheManager:
 
             pl.from_pandas(df).write_ipc(str(cache_path))
 
-            checksum = CacheValidator.calculate_checksum(cache_path)
+            # Hash in a worker thread so multi-MB files don't stall the event loop
+            checksum = await asyncio.to_thread(CacheValidator.calculate_cache_checksum, cache_path)
             record_count = len(df)
 
             logger.info(
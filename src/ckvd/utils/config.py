@@ -11,10 +11,14 @@ scattered across multiple files, creating a single source of truth for system-wi
 import os
 from datetime import timedelta, timezone
 from enum import Enum, auto
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import attrs
-import pandas as pd
+
+if TYPE_CHECKING:
+    # pandas is imported inside the DataFrame factories below so that reading
+    # constants from this module (which nearly every module does) stays light
+    import pandas as pd
 
 # Time-related constants
 DEFAULT_TIMEZONE: Final = timezone.utc
@@ -45,6 +49,7 @@ INCOMPLETE_BAR_THRESHOLD: Final = timedelta(minutes=5)  # Time after which bars
 MAX_CACHE_AGE: Final = timedelta(days=30)
 CACHE_UPDATE_INTERVAL: Final = timedelta(minutes=5)
 MIN_VALID_FILE_SIZE: Final = 1024  # 1KB minimum
+PARALLEL_CHECKSUM_MIN_SIZE: Final = 100 * 1024 * 1024  # Cache files this large get chunked checksums
 
 # API constraints
 MAX_TIMEOUT: Final = 9.0  # Maximum timeout for any individual operation in seconds
@@ -161,6 +166,7 @@ CLOSE_TIME_ADJUSTMENT: Final[int] = 999  # Milliseconds to add to close_time
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 DEFAULT_ACCEPT_HEADER: Final[str] = "application/json"
 DEFAULT_HTTP_TIMEOUT_SECONDS: Final[float] = 3.0  # Standardized timeout for all HTTP requests
+HTTP_KEEPALIVE_EXPIRY_SECONDS: Final[float] = 30.0  # Idle pooled connections outlive pauses between requests
 
 # HTTP status codes
 HTTP_OK: Final = 200  # Standard HTTP OK status code
@@ -260,7 +266,7 @@ FEATURE_FLAGS = {
 
 
 # Create a standard empty DataFrame with proper structure
-def create_empty_dataframe(chart_type=None) -> pd.DataFrame:
+def create_empty_dataframe(chart_type=None) -> "pd.DataFrame":
     """Create an empty DataFrame with the standard market data structure.
 
     Args:
@@ -270,6 +276,8 @@ def create_empty_dataframe(chart_type=None) -> pd.DataFrame:
     Returns:
         An empty DataFrame with correct column types and index
     """
+    import pandas as pd
+
     from ckvd.utils.loguru_setup import logger
     from ckvd.utils.market_constraints import ChartType
 
@@ -318,7 +326,7 @@ def create_empty_dataframe(chart_type=None) -> pd.DataFrame:
 
 
 # Create a standard empty funding rate DataFrame with proper structure
-def create_empty_funding_rate_dataframe() -> pd.DataFrame:
+def create_empty_funding_rate_dataframe() -> "pd.DataFrame":
     """Create an empty DataFrame with the standard funding rate data structure.
 
     Returns:
@@ -334,7 +342,7 @@ def create_empty_funding_rate_dataframe() -> pd.DataFrame:
 
 
 # Function to standardize column names across different API responses
-def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
+def standardize_column_names(df: "pd.DataFrame") -> "pd.DataFrame":
     """Standardize column names in DataFrame to use canonical names.
 
     This function ensures column names follow the canonical naming convention.
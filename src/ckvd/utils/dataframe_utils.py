@@ -28,6 +28,26 @@ from ckvd.utils.config import (
 )
 from ckvd.utils.loguru_setup import logger
 
+# OUTPUT_DTYPES/FUNDING_RATE_DTYPES resolved to dtype objects once, so per-call
+# dtype checks compare objects instead of formatting str(dtype) for each column
+_RESOLVED_OUTPUT_DTYPES = {col: pd.api.types.pandas_dtype(dtype) for col, dtype in OUTPUT_DTYPES.items()}
+_RESOLVED_FUNDING_RATE_DTYPES = {col: pd.api.types.pandas_dtype(dtype) for col, dtype in FUNDING_RATE_DTYPES.items()}
+
+
+def _is_utc(tz: object) -> bool:
+    """Check whether a tzinfo is UTC regardless of implementation.
+
+    Arrow/Polars round-trips yield pytz or zoneinfo UTC, which compare unequal to
+    timezone.utc; treating them as foreign would tz_convert UTC data to UTC.
+
+    Args:
+        tz: tzinfo from a DatetimeIndex or datetime Series
+
+    Returns:
+        True for timezone.utc, pytz.UTC and ZoneInfo("UTC")
+    """
+    return tz is timezone.utc or str(tz) == "UTC"
+
 
 def _create_synthetic_timestamps(count: int) -> list[datetime]:
     """Create synthetic minute-interval UTC timestamps for fallback indexing.
@@ -122,7 +142,7 @@ def ensure_open_time_as_column(df: pd.DataFrame) -> pd.DataFrame:
             if dt.tz is None:
                 logger.debug(f"Localizing {CANONICAL_INDEX_NAME} to UTC")
                 df[CANONICAL_INDEX_NAME] = dt.tz_localize(timezone.utc)
-            elif dt.tz != timezone.utc:
+            elif not _is_utc(dt.tz):
                 logger.debug(f"Converting {CANONICAL_INDEX_NAME} timezone to UTC")
                 df[CANONICAL_INDEX_NAME] = dt.tz_convert(timezone.utc)
 
@@ -165,7 +185,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
                 logger.debug("Localizing timezone-naive DatetimeIndex to UTC")
                 df.index = df.index.tz_localize(timezone.utc)
             # Case 1b: index has non-UTC timezone - convert to UTC
-            elif df.index.tz != timezone.utc:
+            elif not _is_utc(df.index.tz):
                 logger.debug(f"Converting DatetimeIndex timezone from {df.index.tz} to UTC")
                 df.index = df.index.tz_convert(timezone.utc)
 
@@ -188,7 +208,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
                 if dt.tz is None:
                     logger.debug("Localizing open_time column to UTC before setting as index")
                     df[CANONICAL_INDEX_NAME] = dt.tz_localize(timezone.utc)
-                elif dt.tz != timezone.utc:
+                elif not _is_utc(dt.tz):
                     logger.debug(f"Converting open_time column timezone from {dt.tz} to UTC")
                     df[CANONICAL_INDEX_NAME] = dt.tz_convert(timezone.utc)
 
@@ -255,7 +275,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
             if df.index.tz is None:
                 logger.debug("Localizing index to UTC")
                 df.index = df.index.tz_localize(timezone.utc)
-            elif df.index.tz != timezone.utc:
+            elif not _is_utc(df.index.tz):
                 logger.debug("Converting index timezone to UTC")
                 df.index = df.index.tz_convert(timezone.utc)
 
@@ -477,15 +497,19 @@ def convert_to_standardized_formats(df: pd.DataFrame, output_format: str = "defa
         return df
 
     # Select appropriate dtype mapping based on chart type
-    dtypes = FUNDING_RATE_DTYPES if chart_type.lower() == "funding_rate" else OUTPUT_DTYPES
+    dtypes = _RESOLVED_FUNDING_RATE_DTYPES if chart_type.lower() == "funding_rate" else _RESOLVED_OUTPUT_DTYPES
 
     # MEMORY OPTIMIZATION (Round 6): Batch dtype conversion instead of per-column loop.
     # Skip columns that already have the correct dtype to avoid unnecessary copies.
     # Use try/except per column to preserve robustness for unconvertible values.
     dtype_dict = {}
     for col, dtype in dtypes.items():
-        if col in df.columns and str(df[col].dtype) != dtype:
-            dtype_dict[col] = dtype
+        if col in df.columns:
+            current = df[col].dtype
+            # The name check only runs on a mismatch and keeps equivalent dtypes
+            # (e.g. pyarrow-backed "string") from being converted
+            if current != dtype and str(current) != str(dtype):
+                dtype_dict[col] = dtype
     if dtype_dict:
         try:
             df = df.astype(dtype_dict)
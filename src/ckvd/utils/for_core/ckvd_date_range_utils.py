@@ -209,8 +209,8 @@ def get_date_range_description(
     orig_end = original_params.get("end_time")
     days = original_params.get("days", 3)
 
-    start_date_str = start_time.format("YYYY-MM-DD")
-    end_date_str = end_time.format("YYYY-MM-DD")
+    start_date_str = start_time.strftime("%Y-%m-%d")
+    end_date_str = end_time.strftime("%Y-%m-%d")
 
     if orig_start and orig_end:
         return f"Using explicit date range: {start_date_str} to {end_date_str}"
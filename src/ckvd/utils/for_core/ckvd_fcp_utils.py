@@ -20,6 +20,7 @@ from ckvd.utils.market_constraints import (
     Interval,
     MarketType,
     get_market_capabilities,
+    get_minimum_interval,
     is_interval_supported,
 )
 
@@ -39,7 +40,7 @@ def validate_interval(market_type: MarketType, interval: Interval) -> None:
         supported_intervals = [i.value for i in capabilities.supported_intervals]
 
         # Find the minimum supported interval for suggestion
-        min_interval = min(capabilities.supported_intervals, key=lambda x: x.to_seconds())
+        min_interval = get_minimum_interval(market_type)
 
         error_msg = (
             f"Interval {interval.value} is not supported by {market_type.name} market. "
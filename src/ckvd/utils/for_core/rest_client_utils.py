@@ -16,7 +16,7 @@ from typing import Any
 import httpx
 import orjson
 
-from ckvd.utils.config import DEFAULT_HTTP_TIMEOUT_SECONDS, HTTP_OK
+from ckvd.utils.config import DEFAULT_HTTP_TIMEOUT_SECONDS, HTTP_KEEPALIVE_EXPIRY_SECONDS, HTTP_OK
 from ckvd.utils.for_core.rest_exceptions import (
     APIError,
     HTTPError,
@@ -47,6 +47,11 @@ def create_optimized_client() -> httpx.Client:
             "Content-Type": "application/json",
         },
         timeout=DEFAULT_HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
         follow_redirects=True,
     )
 
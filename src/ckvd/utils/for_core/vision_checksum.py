@@ -21,6 +21,7 @@ from ckvd.utils.loguru_setup import logger
 # Pre-compiled regex patterns for SHA256 checksum validation
 SHA256_PATTERN = re.compile(r"([a-fA-F0-9]{64})")
 SHA256_EXACT_PATTERN = re.compile(r"^[a-fA-F0-9]{64}$")
+_WORD_PATTERN = re.compile(r"\b\w+\b")
 
 
 def verify_file_checksum(file_path: Path, checksum_path: Path) -> tuple[bool, str | None]:
@@ -146,7 +147,7 @@ def extract_checksum_from_file(checksum_path: Path) -> str | None:
 
         # Method 3: Try finding all words and look for a 64-char hex string
         # Use finditer() for lazy matching — stops at first match without allocating full word list
-        for match in re.finditer(r"\b\w+\b", text_content):
+        for match in _WORD_PATTERN.finditer(text_content):
             word = match.group()
             if len(word) == SHA256_HASH_LENGTH and is_valid_sha256(word):
                 logger.debug(f"Extracted checksum from word list: {word}")
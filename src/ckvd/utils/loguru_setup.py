@@ -56,6 +56,58 @@ from loguru import logger as _loguru_logger
 # Remove default loguru handler to have full control
 _loguru_logger.remove()
 
+# Caller-depth view shared by the CKVDLogger level methods. It reuses loguru's
+# core, so handlers added or removed later still apply, and building it once
+# avoids an opt() Logger allocation on every log call.
+_caller_logger = _loguru_logger.opt(depth=1)
+
+
+class _UngatedCore:
+    """Stand-in for loguru's core that lets every record through."""
+
+    min_level = 0
+
+
+def _resolve_level_gate(loguru_logger) -> object:
+    """Return loguru's core if it exposes ``min_level``, else an always-open gate.
+
+    Args:
+        loguru_logger: The loguru logger whose core should gate log calls
+
+    Returns:
+        Object with a numeric ``min_level`` attribute
+    """
+    core = getattr(loguru_logger, "_core", None)
+    if isinstance(getattr(core, "min_level", None), (int, float)):
+        return core
+    return _UngatedCore()
+
+
+# loguru tracks the lowest level accepted by any sink on its core (infinity
+# when there are none). Checking it first lets filtered calls return without
+# entering loguru's record path. The attribute is private, so if a loguru
+# release drops it every call simply goes straight to loguru instead.
+_loguru_core = _resolve_level_gate(_loguru_logger)
+
+
+def _handlers_installed(handler_ids: tuple[int, ...]) -> bool:
+    """Check whether all given loguru handler ids are still registered.
+
+    loguru has no public API to list handlers, so this reads the private
+    core defensively and reports False (forcing a rebuild) when it cannot tell.
+
+    Args:
+        handler_ids: Ids returned by ``logger.add``
+
+    Returns:
+        True only if every id is known to still be installed
+    """
+    handlers = getattr(getattr(_loguru_logger, "_core", None), "handlers", None)
+    if not handler_ids or handlers is None:
+        return False
+    return all(handler_id in handlers for handler_id in handler_ids)
+
+
 # Configuration from environment
 DEFAULT_LOG_LEVEL = os.getenv("CKVD_LOG_LEVEL", "ERROR").upper()
 LOG_FILE = os.getenv("CKVD_LOG_FILE")
@@ -72,6 +124,16 @@ LOG_FORMAT = (
 # Simple format for when colors are disabled
 SIMPLE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
 
+# Level lookups for the stdlib-compatible methods, built once rather than per call
+_LEVEL_NAMES_BY_NUMBER = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+_LEVEL_HIERARCHY = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 
 class CKVDLogger:
     """Simple wrapper around loguru that provides easy configuration and compatibility."""
@@ -81,10 +143,22 @@ class CKVDLogger:
         self._current_level = DEFAULT_LOG_LEVEL
         self._log_file = LOG_FILE
         self._disable_colors = DISABLE_COLORS
+        self._applied_config: tuple | None = None
+        self._handler_ids: tuple[int, ...] = ()
         self._setup_logger()
 
     def _setup_logger(self) -> None:
         """Set up loguru logger with current configuration."""
+        # Rebuilding sinks takes milliseconds and every CryptoKlineVisionData
+        # instance reconfigures the level, so skip it when nothing changed and
+        # CKVD's own sinks are still installed (application code may have
+        # called loguru's remove() in between). sys.stderr is part of the key
+        # so a redirected stream gets a new sink.
+        config = (self._current_level, self._log_file, self._disable_colors, sys.stderr)
+        if config == self._applied_config and _handlers_installed(self._handler_ids):
+            return
+        self._applied_config = config
+
         # Remove any existing handlers
         _loguru_logger.remove()
 
@@ -92,34 +166,45 @@ class CKVDLogger:
         format_template = SIMPLE_FORMAT if self._disable_colors else LOG_FORMAT
 
         # Add console handler
-        _loguru_logger.add(
-            sys.stderr,
-            level=self._current_level,
-            format=format_template,
-            colorize=not self._disable_colors,
-            backtrace=True,
-            diagnose=True,
-        )
+        handler_ids = [
+            _loguru_logger.add(
+                sys.stderr,
+                level=self._current_level,
+                format=format_template,
+                colorize=not self._disable_colors,
+                backtrace=True,
+                diagnose=True,
+            )
+        ]
 
         # Add file handler if specified
         if self._log_file:
             log_path = Path(self._log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            _loguru_logger.add(
-                str(log_path),
-                level=self._current_level,
-                format=format_template,
-                rotation="10 MB",  # Rotate when file reaches 10MB
-                retention="1 week",  # Keep logs for 1 week
-                compression="zip",  # Compress rotated logs
-                backtrace=True,
-                diagnose=True,
+            handler_ids.append(
+                _loguru_logger.add(
+                    str(log_path),
+                    level=self._current_level,
+                    format=format_template,
+                    rotation="10 MB",  # Rotate when file reaches 10MB
+                    retention="1 week",  # Keep logs for 1 week
+                    compression="zip",  # Compress rotated logs
+                    backtrace=True,
+                    diagnose=True,
+                )
             )
 
+        self._handler_ids = tuple(handler_ids)
+
     def configure_level(self, level: str) -> "CKVDLogger":
         """Configure the log level.
 
+        Re-applying the current configuration is a no-op while CKVD's own
+        sinks are still installed, so sinks added directly through loguru
+        survive it. If those sinks were removed (e.g. by ``loguru.logger.remove()``),
+        all handlers are replaced and CKVD's stderr/file sinks are restored.
+
         Args:
             level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
@@ -159,32 +244,38 @@ class CKVDLogger:
     # Delegate all logging methods to loguru
     def debug(self, message: str, *args, **kwargs):
         """Log a debug message."""
-        _loguru_logger.opt(depth=1).debug(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.DEBUG:
+            _caller_logger.debug(message, *args, **kwargs)
         return self
 
     def info(self, message: str, *args, **kwargs):
         """Log an info message."""
-        _loguru_logger.opt(depth=1).info(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.INFO:
+            _caller_logger.info(message, *args, **kwargs)
         return self
 
     def warning(self, message: str, *args, **kwargs):
         """Log a warning message."""
-        _loguru_logger.opt(depth=1).warning(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.WARNING:
+            _caller_logger.warning(message, *args, **kwargs)
         return self
 
     def error(self, message: str, *args, **kwargs):
         """Log an error message."""
-        _loguru_logger.opt(depth=1).error(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.ERROR:
+            _caller_logger.error(message, *args, **kwargs)
         return self
 
     def critical(self, message: str, *args, **kwargs):
         """Log a critical message."""
-        _loguru_logger.opt(depth=1).critical(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.CRITICAL:
+            _caller_logger.critical(message, *args, **kwargs)
         return self
 
     def exception(self, message: str, *args, **kwargs):
         """Log an exception with traceback."""
-        _loguru_logger.opt(depth=1).exception(message, *args, **kwargs)
+        if _loguru_core.min_level <= logging.ERROR:
+            _caller_logger.exception(message, *args, **kwargs)
         return self
 
     # Compatibility methods for existing logger interface
@@ -192,8 +283,7 @@ class CKVDLogger:
         """Set log level (compatibility method)."""
         if isinstance(level, int):
             # Convert numeric levels to string
-            level_map = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
-            level = level_map.get(level, "INFO")
+            level = _LEVEL_NAMES_BY_NUMBER.get(level, "INFO")
         return self.configure_level(level)
 
     def getEffectiveLevel(self) -> str:
@@ -203,12 +293,10 @@ class CKVDLogger:
     def isEnabledFor(self, level: str | int) -> bool:
         """Check if logging is enabled for the given level."""
         if isinstance(level, int):
-            level_map = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
-            level = level_map.get(level, "INFO")
+            level = _LEVEL_NAMES_BY_NUMBER.get(level, "INFO")
 
-        level_hierarchy = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        current_index = level_hierarchy.index(self._current_level)
-        check_index = level_hierarchy.index(level.upper())
+        current_index = _LEVEL_HIERARCHY.index(self._current_level)
+        check_index = _LEVEL_HIERARCHY.index(level.upper())
         return check_index >= current_index
 
     # Expose loguru's advanced features
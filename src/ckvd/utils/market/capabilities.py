@@ -22,15 +22,19 @@ __all__ = [
 ]
 
 
-@attrs.define
+@attrs.define(frozen=True)
 class MarketCapabilities:
-    """Encapsulates the capabilities and constraints of a market type."""
+    """Encapsulates the capabilities and constraints of a market type.
+
+    Instances are frozen: they are shared module-level constants, and callers
+    cache values derived from them (e.g. supported-interval sets).
+    """
 
     primary_endpoint: str = attrs.field()  # Primary API endpoint
-    backup_endpoints: list[str] = attrs.field()  # List of backup endpoints
+    backup_endpoints: tuple[str, ...] = attrs.field(converter=tuple)  # Backup endpoints
     data_only_endpoint: str | None = attrs.field()  # Endpoint for market data only
     api_version: str = attrs.field()  # API version to use
-    supported_intervals: list[Interval] = attrs.field()  # List of supported intervals
+    supported_intervals: tuple[Interval, ...] = attrs.field(converter=tuple)  # Supported intervals, ascending
     symbol_format: str = attrs.field()  # Example format for symbols
     description: str = attrs.field()  # Detailed description of market capabilities
     max_limit: int = attrs.field()  # Maximum number of records per request
@@ -47,10 +51,11 @@ class MarketCapabilities:
         return self.primary_endpoint
 
 
-# Shared interval lists to avoid duplication
-_BINANCE_FUTURES_INTERVALS = [i for i in Interval if i.value != "1s"]
+# Shared immutable interval tuples to avoid duplication
+_ALL_INTERVALS = tuple(Interval)
+_BINANCE_FUTURES_INTERVALS = tuple(i for i in Interval if i is not Interval.SECOND_1)
 
-_OKX_SUPPORTED_INTERVALS = [
+_OKX_SUPPORTED_INTERVALS = (
     Interval.MINUTE_1,
     Interval.MINUTE_3,
     Interval.MINUTE_5,
@@ -64,29 +69,29 @@ _OKX_SUPPORTED_INTERVALS = [
     Interval.DAY_1,
     Interval.WEEK_1,
     Interval.MONTH_1,
-]
+)
 
 # Shared Binance futures endpoint configuration
-_BINANCE_FAPI_BACKUP_ENDPOINTS = [
+_BINANCE_FAPI_BACKUP_ENDPOINTS = (
     "https://fapi-gcp.binance.com",
     "https://fapi1.binance.com",
     "https://fapi2.binance.com",
     "https://fapi3.binance.com",
-]
+)
 
 MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
     MarketType.SPOT: MarketCapabilities(
         primary_endpoint="https://api.binance.com",
-        backup_endpoints=[
+        backup_endpoints=(
             "https://api-gcp.binance.com",
             "https://api1.binance.com",
             "https://api2.binance.com",
             "https://api3.binance.com",
             "https://api4.binance.com",
-        ],
+        ),
         data_only_endpoint="https://data-api.binance.vision",
         api_version="v3",
-        supported_intervals=list(Interval),  # All intervals including 1s
+        supported_intervals=_ALL_INTERVALS,  # All intervals including 1s
         symbol_format="BTCUSDT",
         description=(
             "Spot market with comprehensive support for all intervals including 1-second data. "
@@ -114,12 +119,12 @@ MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
     ),
     MarketType.FUTURES_COIN: MarketCapabilities(
         primary_endpoint="https://dapi.binance.com",
-        backup_endpoints=[
+        backup_endpoints=(
             "https://dapi-gcp.binance.com",
             "https://dapi1.binance.com",
             "https://dapi2.binance.com",
             "https://dapi3.binance.com",
-        ],
+        ),
         data_only_endpoint=None,
         api_version="v1",
         supported_intervals=_BINANCE_FUTURES_INTERVALS,
@@ -151,11 +156,11 @@ MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
     ),
     MarketType.OPTIONS: MarketCapabilities(
         primary_endpoint="https://eapi.binance.com",
-        backup_endpoints=[
+        backup_endpoints=(
             "https://eapi1.binance.com",
             "https://eapi2.binance.com",
             "https://eapi3.binance.com",
-        ],
+        ),
         data_only_endpoint=None,
         api_version="v1",
         supported_intervals=_BINANCE_FUTURES_INTERVALS,
@@ -174,7 +179,7 @@ MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
 OKX_MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
     MarketType.SPOT: MarketCapabilities(
         primary_endpoint="https://www.okx.com",
-        backup_endpoints=[],
+        backup_endpoints=(),
         data_only_endpoint=None,
         api_version="v5",
         supported_intervals=_OKX_SUPPORTED_INTERVALS,
@@ -190,7 +195,7 @@ OKX_MARKET_CAPABILITIES: dict[MarketType, MarketCapabilities] = {
     ),
     MarketType.FUTURES_USDT: MarketCapabilities(
         primary_endpoint="https://www.okx.com",
-        backup_endpoints=[],
+        backup_endpoints=(),
         data_only_endpoint=None,
         api_version="v5",
         supported_intervals=_OKX_SUPPORTED_INTERVALS,
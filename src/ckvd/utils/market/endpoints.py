@@ -18,6 +18,15 @@ __all__ = [
     "get_endpoint_url",
 ]
 
+# Binance REST path prefix per market type name; unknown names use "api"
+_BINANCE_API_PREFIXES: dict[str, str] = {
+    "SPOT": "api",
+    "FUTURES_USDT": "fapi",
+    "FUTURES_COIN": "dapi",
+    "FUTURES": "fapi",
+    "OPTIONS": "eapi",
+}
+
 
 def get_endpoint_url(
     market_type: MarketType,
@@ -58,23 +67,7 @@ def get_endpoint_url(
     if version is None:
         version = capabilities.api_version
 
-    # Handle different providers
-    if data_provider.name == "OKX":
-        path = f"/api/{version}/{endpoint}"
-    else:
-        # Binance endpoints based on market type
-        market_name = market_type.name
-        if market_name == "SPOT":
-            path = f"/api/{version}/{endpoint}"
-        elif market_name == "FUTURES_USDT":
-            path = f"/fapi/{version}/{endpoint}"
-        elif market_name == "FUTURES_COIN":
-            path = f"/dapi/{version}/{endpoint}"
-        elif market_name == "FUTURES":
-            path = f"/fapi/{version}/{endpoint}"
-        elif market_name == "OPTIONS":
-            path = f"/eapi/{version}/{endpoint}"
-        else:
-            path = f"/api/{version}/{endpoint}"
+    # OKX always uses /api; Binance prefixes depend on the market type
+    prefix = "api" if data_provider.name == "OKX" else _BINANCE_API_PREFIXES.get(market_type.name, "api")
 
-    return f"{base_url}{path}"
+    return f"{base_url}/{prefix}/{version}/{endpoint}"
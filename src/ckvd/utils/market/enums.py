@@ -14,6 +14,16 @@ This module defines the core enums used throughout the Crypto Kline Vision Data:
 import re
 from enum import Enum, auto
 
+# MarketType property tables, keyed by member name so they survive module reloads
+_FUTURES_MARKET_NAMES = frozenset({"FUTURES", "FUTURES_USDT", "FUTURES_COIN"})
+_MARKET_VISION_API_PATHS: dict[str, str] = {
+    "SPOT": "spot",
+    "FUTURES_USDT": "futures/um",
+    "FUTURES_COIN": "futures/cm",
+    "FUTURES": "futures/um",  # Default to UM for backward compatibility
+    "OPTIONS": "options",  # Options path (if supported)
+}
+
 # Pre-compiled regex pattern for parsing interval strings (performance optimization)
 INTERVAL_PATTERN = re.compile(r"(\d+)([smhdwM])")
 
@@ -56,15 +66,10 @@ class DataProvider(Enum):
         Raises:
             ValueError: If the string doesn't match any known data provider
         """
-        mapping = {
-            "binance": cls.BINANCE,
-            "tradestation": cls.TRADESTATION,
-            "okx": cls.OKX,
-        }
-
         provider_str = provider_str.lower()
-        if provider_str in mapping:
-            return mapping[provider_str]
+        provider = _DATA_PROVIDER_ALIASES.get(provider_str)
+        if provider is not None:
+            return provider
 
         raise ValueError(f"Unknown data provider string: {provider_str}")
 
@@ -81,23 +86,16 @@ class MarketType(Enum):
     @property
     def is_futures(self) -> bool:
         """Check if this is any type of futures market."""
-        return self.name in ("FUTURES", "FUTURES_USDT", "FUTURES_COIN")
+        return self.name in _FUTURES_MARKET_NAMES
 
     @property
     def vision_api_path(self) -> str:
         """Get the corresponding path component for Binance Vision API."""
-        # Use name comparison instead of direct comparison to avoid module reloading issues
-        if self.name == "SPOT":
-            return "spot"
-        if self.name == "FUTURES_USDT":
-            return "futures/um"
-        if self.name == "FUTURES_COIN":
-            return "futures/cm"
-        if self.name == "FUTURES":
-            return "futures/um"  # Default to UM for backward compatibility
-        if self.name == "OPTIONS":
-            return "options"  # Options path (if supported)
-        raise ValueError(f"Unknown market type: {self}")
+        # Keyed by name instead of member to avoid module reloading issues
+        path = _MARKET_VISION_API_PATHS.get(self.name)
+        if path is None:
+            raise ValueError(f"Unknown market type: {self}")
+        return path
 
     @classmethod
     def from_string(cls, market_type_str: str) -> "MarketType":
@@ -112,20 +110,10 @@ class MarketType(Enum):
         Raises:
             ValueError: If the string doesn't match any known market type
         """
-        mapping = {
-            "spot": cls.SPOT,
-            "futures": cls.FUTURES,
-            "futures_usdt": cls.FUTURES_USDT,
-            "um": cls.FUTURES_USDT,
-            "futures_coin": cls.FUTURES_COIN,
-            "cm": cls.FUTURES_COIN,
-            "options": cls.OPTIONS,
-            "eapi": cls.OPTIONS,
-        }
-
         market_type_str = market_type_str.lower()
-        if market_type_str in mapping:
-            return mapping[market_type_str]
+        market_type = _MARKET_TYPE_ALIASES.get(market_type_str)
+        if market_type is not None:
+            return market_type
 
         raise ValueError(f"Unknown market type string: {market_type_str}")
 
@@ -202,16 +190,10 @@ class ChartType(Enum):
         Raises:
             ValueError: If the string doesn't match any known chart type
         """
-        mapping = {
-            "klines": cls.KLINES,
-            "fundingrate": cls.FUNDING_RATE,
-            "candles": cls.OKX_CANDLES,
-            "history-candles": cls.OKX_HISTORY_CANDLES,
-        }
-
         chart_type_str = chart_type_str.lower()
-        if chart_type_str in mapping:
-            return mapping[chart_type_str]
+        chart_type = _CHART_TYPE_ALIASES.get(chart_type_str)
+        if chart_type is not None:
+            return chart_type
 
         raise ValueError(f"Unknown chart type string: {chart_type_str}")
 
@@ -306,6 +288,31 @@ class Interval(Enum):
         return self.value
 
 
+# Lowercase string aliases for the from_string() parsers — built once instead of per call
+_DATA_PROVIDER_ALIASES: dict[str, DataProvider] = {
+    "binance": DataProvider.BINANCE,
+    "tradestation": DataProvider.TRADESTATION,
+    "okx": DataProvider.OKX,
+}
+
+_MARKET_TYPE_ALIASES: dict[str, MarketType] = {
+    "spot": MarketType.SPOT,
+    "futures": MarketType.FUTURES,
+    "futures_usdt": MarketType.FUTURES_USDT,
+    "um": MarketType.FUTURES_USDT,
+    "futures_coin": MarketType.FUTURES_COIN,
+    "cm": MarketType.FUTURES_COIN,
+    "options": MarketType.OPTIONS,
+    "eapi": MarketType.OPTIONS,
+}
+
+_CHART_TYPE_ALIASES: dict[str, ChartType] = {
+    "klines": ChartType.KLINES,
+    "fundingrate": ChartType.FUNDING_RATE,
+    "candles": ChartType.OKX_CANDLES,
+    "history-candles": ChartType.OKX_HISTORY_CANDLES,
+}
+
 # Pre-computed Interval→seconds lookup — avoids per-call regex + dict build in to_seconds()
 _INTERVAL_SECONDS: dict["Interval", int] = {
     i: int(m.group(1)) * _TIME_MULTIPLIERS[m.group(2)]
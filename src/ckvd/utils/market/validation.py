@@ -29,6 +29,10 @@ _SYMBOL_SAFE_PATTERN = re.compile(r"^[A-Z0-9_-]{1,30}$")
 # get_market_capabilities() + list scan in is_interval_supported() hot path
 _SUPPORTED_INTERVALS_CACHE: dict[MarketType, frozenset[Interval]] = {}
 
+# Minimum interval per market type — supported intervals are static, so the
+# min() scan only needs to run once per market type
+_MINIMUM_INTERVAL_CACHE: dict[MarketType, Interval] = {}
+
 __all__ = [
     "get_default_symbol",
     "get_market_symbol_format",
@@ -65,8 +69,12 @@ def get_minimum_interval(market_type: MarketType) -> Interval:
     Returns:
         Interval: The minimum supported interval for the market type
     """
-    capabilities = get_market_capabilities(market_type)
-    return min(capabilities.supported_intervals, key=lambda x: x.to_seconds())
+    cached = _MINIMUM_INTERVAL_CACHE.get(market_type)
+    if cached is None:
+        capabilities = get_market_capabilities(market_type)
+        cached = min(capabilities.supported_intervals, key=Interval.to_seconds)
+        _MINIMUM_INTERVAL_CACHE[market_type] = cached
+    return cached
 
 
 def get_default_symbol(market_type: MarketType) -> str:
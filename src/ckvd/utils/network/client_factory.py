@@ -13,7 +13,7 @@ from typing import Any
 import httpx
 from httpx import Limits, Timeout
 
-from ckvd.utils.config import DEFAULT_HTTP_TIMEOUT_SECONDS
+from ckvd.utils.config import DEFAULT_HTTP_TIMEOUT_SECONDS, HTTP_KEEPALIVE_EXPIRY_SECONDS
 from ckvd.utils.loguru_setup import logger
 
 __all__ = [
@@ -26,6 +26,13 @@ __all__ = [
 # Define a generic Client type for HTTP clients
 Client = httpx.Client
 
+# Headers used when the caller supplies none; httpx copies them into each
+# client's own Headers, so one shared mapping is safe
+_DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": f"CryptoKlineVisionData Python/{platform.python_version()}",
+    "Accept": "application/json",
+}
+
 
 def create_httpx_client(
     timeout: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
@@ -61,14 +68,12 @@ def create_httpx_client(
         limits = Limits(
             max_connections=max_connections,
             max_keepalive_connections=max_connections // 2,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
         )
 
-        # Create default headers if none provided
+        # Use default headers if none provided
         if headers is None:
-            headers = {
-                "User-Agent": f"CryptoKlineVisionData Python/{platform.python_version()}",
-                "Accept": "application/json",
-            }
+            headers = _DEFAULT_HEADERS
 
         # Create the client
         client = httpx.Client(
@@ -128,9 +133,14 @@ def safely_close_client(client: Any) -> None:
     if client is None:
         return
 
+    # Every client this module creates is an httpx.Client; close it directly
+    # and only fall back to duck typing for anything else
+    close = client.close if type(client) is httpx.Client else getattr(client, "close", None)
+    if not callable(close):
+        return
+
     try:
-        if hasattr(client, "close") and callable(client.close):
-            client.close()
-            logger.debug("HTTP client closed successfully")
+        close()
+        logger.debug("HTTP client closed successfully")
     except OSError as e:
         logger.warning(f"Error while closing HTTP client: {e}")
@@ -224,11 +224,15 @@ def enforce_utc_timezone(dt: datetime) -> datetime:
     Returns:
         UTC timezone-aware datetime
     """
-    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
+    tzinfo = dt.tzinfo
+    if tzinfo is timezone.utc:
+        # Hot path: already UTC — identity check skips the utcoffset() call
+        return dt
+    if tzinfo is None or tzinfo.utcoffset(dt) is None:
         # If naive datetime, assume it's UTC — use replace() instead of
         # field-by-field constructor to avoid 7 attribute accesses
         return dt.replace(tzinfo=timezone.utc)
-    if dt.tzinfo == timezone.utc:
+    if tzinfo == timezone.utc:
         # datetime is immutable — safe to return same object (no copy needed)
         return dt
     return dt.astimezone(timezone.utc)
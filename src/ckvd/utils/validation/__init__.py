@@ -19,44 +19,58 @@ Package structure:
 - dataframe_validation.py: DataFrame structure validation
 """
 
-from ckvd.utils.validation.availability_data import (
-    FuturesAvailabilityWarning,
-    SymbolAvailability,
-    check_futures_counterpart_availability,
-    get_earliest_date,
-    get_symbol_availability,
-    is_symbol_available_at,
-)
-from ckvd.utils.validation.availability_validation import (
-    is_data_likely_available,
-    validate_data_availability,
-)
-from ckvd.utils.validation.dataframe_validation import (
-    DataFrameValidator,
-)
-from ckvd.utils.validation.file_validation import (
-    calculate_checksum,
-    validate_file_with_checksum,
-)
-from ckvd.utils.validation.time_validation import (
-    DataValidation,
-    ValidationError,
-)
+import importlib
+from typing import Any
+
+# Lazy imports via __getattr__ (same pattern as ckvd.utils): checksum and file
+# helpers must not pull in pandas/httpx through dataframe_validation and
+# time_validation (which imports ApiBoundaryValidator).
+_LAZY_IMPORTS: dict[str, str] = {
+    # From .availability_data
+    "FuturesAvailabilityWarning": ".availability_data",
+    "SymbolAvailability": ".availability_data",
+    "check_futures_counterpart_availability": ".availability_data",
+    "get_earliest_date": ".availability_data",
+    "get_symbol_availability": ".availability_data",
+    "is_symbol_available_at": ".availability_data",
+    # From .availability_validation
+    "is_data_likely_available": ".availability_validation",
+    "validate_data_availability": ".availability_validation",
+    # From .dataframe_validation
+    "DataFrameValidator": ".dataframe_validation",
+    # From .file_validation
+    "PARALLEL_CHECKSUM_PREFIX": ".file_validation",
+    "calculate_checksum": ".file_validation",
+    "calculate_checksum_parallel": ".file_validation",
+    "checksum_matches": ".file_validation",
+    "validate_file_with_checksum": ".file_validation",
+    # From .time_validation (constants re-exported for backward compatibility)
+    "ALL_COLUMNS": ".time_validation",
+    "INTERVAL_PATTERN": ".time_validation",
+    "OHLCV_COLUMNS": ".time_validation",
+    "SYMBOL_PATTERN": ".time_validation",
+    "TICKER_PATTERN": ".time_validation",
+    "DataValidation": ".time_validation",
+    "ValidationError": ".time_validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        val = getattr(module, name)
+        # Cache in module globals for subsequent access (no repeated __getattr__)
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Constants re-exported for backward compatibility
-from ckvd.utils.validation.time_validation import (
-    ALL_COLUMNS,
-    INTERVAL_PATTERN,
-    OHLCV_COLUMNS,
-    SYMBOL_PATTERN,
-    TICKER_PATTERN,
-)
 
 __all__ = [
     # Constants
     "ALL_COLUMNS",
     "INTERVAL_PATTERN",
     "OHLCV_COLUMNS",
+    "PARALLEL_CHECKSUM_PREFIX",
     "SYMBOL_PATTERN",
     "TICKER_PATTERN",
     # Classes
@@ -67,7 +81,9 @@ __all__ = [
     "ValidationError",
     # Functions
     "calculate_checksum",
+    "calculate_checksum_parallel",
     "check_futures_counterpart_availability",
+    "checksum_matches",
     "get_earliest_date",
     "get_symbol_availability",
     "is_data_likely_available",
@@ -12,6 +12,8 @@ This module provides validation for:
 # Refactoring: Split from utils/validation.py for modularity (<400 lines)
 """
 
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -24,6 +26,7 @@ from ckvd.utils.config import (
     MILLISECOND_DIGITS,
     MIN_VALID_FILE_SIZE,
     OUTPUT_DTYPES,
+    SECONDS_IN_DAY,
     TIMESTAMP_PRECISION,
 )
 from ckvd.utils.loguru_setup import logger
@@ -233,18 +236,18 @@ class DataFrameValidator:
         Returns:
             Error information if validation fails, None if valid
         """
-        from pathlib import Path
-
-        file_path_obj = Path(file_path)
-
-        if not file_path_obj.exists():
+        # One os.stat serves the existence, size and age checks; str and Path
+        # inputs are both accepted without building a Path object
+        try:
+            stats = os.stat(file_path)
+        except FileNotFoundError:
             return {
                 "error_type": "file_missing",
-                "message": f"File does not exist: {file_path_obj}",
+                "message": f"File does not exist: {file_path}",
                 "is_recoverable": True,
             }
 
-        file_size = file_path_obj.stat().st_size
+        file_size = stats.st_size
         if file_size < min_size:
             return {
                 "error_type": "file_too_small",
@@ -252,13 +255,11 @@ class DataFrameValidator:
                 "is_recoverable": True,
             }
 
-        file_mtime = datetime.fromtimestamp(file_path_obj.stat().st_mtime, timezone.utc)
-        age = datetime.now(timezone.utc) - file_mtime
-
-        if age > max_age:
+        age_seconds = time.time() - stats.st_mtime
+        if age_seconds > max_age.total_seconds():
             return {
                 "error_type": "file_too_old",
-                "message": f"File too old: {age.days} days",
+                "message": f"File too old: {int(age_seconds // SECONDS_IN_DAY)} days",
                 "is_recoverable": True,
             }
 
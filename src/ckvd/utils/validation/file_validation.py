@@ -4,11 +4,13 @@
 """File validation and checksum utilities.
 
 This module provides validation for file integrity including:
-- SHA-256 checksum calculation
+- SHA-256 checksum calculation (whole-file and chunked/parallel)
 - Cache file integrity validation
 """
 
 import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 
@@ -19,10 +21,18 @@ from ckvd.utils.config import (
 from ckvd.utils.loguru_setup import logger
 
 __all__ = [
+    "PARALLEL_CHECKSUM_PREFIX",
     "calculate_checksum",
+    "calculate_checksum_parallel",
+    "checksum_matches",
     "validate_file_with_checksum",
 ]
 
+# Tag for chunked checksums so they are never compared against whole-file SHA-256.
+# The chunk size is part of format version 1 and must not change without a new tag.
+PARALLEL_CHECKSUM_PREFIX = "pmkl1:"
+_PARALLEL_CHECKSUM_CHUNK_BYTES = 16 * 1024 * 1024
+
 
 def calculate_checksum(file_path: Path) -> str:
     """Calculate SHA-256 checksum of a file.
@@ -33,11 +43,69 @@ def calculate_checksum(file_path: Path) -> str:
     Returns:
         Hexadecimal string of the SHA-256 checksum
     """
-    hash_sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
-    return hash_sha256.hexdigest()
+        try:
+            # Hash the whole file in one update() over a read-only memory map:
+            # no per-chunk bytes allocations, and hashlib releases the GIL
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (ValueError, OSError):
+            # Empty files cannot be mapped and some filesystems do not support
+            # mmap; file_digest streams through one reused buffer in C instead
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _sha256_chunk(view: memoryview, offset: int) -> bytes:
+    """Hash one fixed-size region of a mapped file."""
+    with view[offset : offset + _PARALLEL_CHECKSUM_CHUNK_BYTES] as chunk:
+        return hashlib.sha256(chunk).digest()
+
+
+def calculate_checksum_parallel(file_path: Path, max_workers: int | None = None) -> str:
+    """Calculate a chunked SHA-256 checksum of a file using worker threads.
+
+    The file is split into 16 MiB regions hashed concurrently (hashlib releases
+    the GIL), and the result is the SHA-256 of the concatenated region digests.
+    This differs from the whole-file SHA-256, so the value carries the
+    PARALLEL_CHECKSUM_PREFIX tag.
+
+    Args:
+        file_path: Path to the file
+        max_workers: Thread pool size (defaults to the executor's default)
+
+    Returns:
+        Tagged hexadecimal checksum string
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty or unmappable file: read it through a buffer and use the same chunking
+            data = memoryview(f.read())
+            offsets = range(0, len(data), _PARALLEL_CHECKSUM_CHUNK_BYTES)
+            digests = [_sha256_chunk(data, offset) for offset in offsets]
+        else:
+            with mm, memoryview(mm) as view:
+                offsets = range(0, len(view), _PARALLEL_CHECKSUM_CHUNK_BYTES)
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    digests = list(pool.map(_sha256_chunk, [view] * len(offsets), offsets))
+
+    return PARALLEL_CHECKSUM_PREFIX + hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+def checksum_matches(file_path: Path, expected_checksum: str) -> bool:
+    """Check a file against a stored checksum in either supported format.
+
+    Args:
+        file_path: Path to the file
+        expected_checksum: Whole-file SHA-256 or PARALLEL_CHECKSUM_PREFIX-tagged value
+
+    Returns:
+        True if the recomputed checksum equals the stored one
+    """
+    if expected_checksum.startswith(PARALLEL_CHECKSUM_PREFIX):
+        return calculate_checksum_parallel(file_path) == expected_checksum
+    return calculate_checksum(file_path) == expected_checksum
 
 
 def validate_file_with_checksum(
@@ -65,8 +133,7 @@ def validate_file_with_checksum(
 
     if expected_checksum:
         try:
-            actual_checksum = calculate_checksum(file_path)
-            return actual_checksum == expected_checksum
+            return checksum_matches(file_path, expected_checksum)
         except OSError as e:
             logger.error(f"Error calculating checksum for {file_path}: {e}")
             return False
@@ -2073,6 +2073,23 @@ class TestBatchAstype:
         # When all dtypes match, no batch astype should be needed
         assert astype_called["count"] == 0
 
+    def test_equivalent_string_storage_not_converted(self):
+        """pyarrow-backed string columns already satisfy the "string" dtype."""
+        from ckvd.utils.dataframe_utils import convert_to_standardized_formats
+
+        df = pd.DataFrame(
+            {
+                "contracts": pd.array(["BTCUSDT", "BTCUSDT"], dtype="string[pyarrow]"),
+                "funding_interval": pd.array(["8h", "8h"], dtype="string[pyarrow]"),
+                "funding_rate": [0.0001, 0.0002],
+            }
+        )
+
+        result = convert_to_standardized_formats(df, chart_type="funding_rate")
+
+        assert result["contracts"].dtype == pd.StringDtype("pyarrow")
+        assert result["funding_interval"].dtype == pd.StringDtype("pyarrow")
+
     def test_partial_conversion_failure_handled(self):
         """If batch astype fails, per-column fallback should handle it."""
         from ckvd.utils.dataframe_utils import convert_to_standardized_formats
@@ -2975,3 +2992,40 @@ class TestSourceInfoListConversion:
         info = get_data_source_info(pd.DataFrame())
         assert info["sources"] == []
         assert info["source_counts"] == {}
+
+
+# =============================================================================
+# Arrow cache reads: UTC index from pytz/zoneinfo is not re-converted
+# =============================================================================
+
+
+class TestEnsureOpenTimeIndexUtcVariants:
+    """ensure_open_time_as_index() must accept any UTC tzinfo as-is.
+
+    Arrow/Polars to_pandas() yields pytz UTC, which compares unequal to
+    timezone.utc; the index must not be tz_convert'ed UTC→UTC on every read.
+    """
+
+    def test_polars_utc_index_kept(self, base_time):
+        """Index coming from a Polars UTC column is reused, not converted."""
+        from ckvd.utils.dataframe_utils import ensure_open_time_as_index
+
+        times = pl.Series("open_time", pd.date_range(base_time, periods=3, freq="h")).dt.replace_time_zone("UTC")
+        index = pd.DatetimeIndex(times.to_pandas(), name="open_time")
+        df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+
+        result = ensure_open_time_as_index(df)
+
+        assert result.index is index
+
+    def test_non_utc_index_still_converted(self, base_time):
+        """A genuinely different timezone is still converted to UTC."""
+        from ckvd.utils.dataframe_utils import ensure_open_time_as_index
+
+        index = pd.date_range("2024-01-15", periods=3, freq="h", tz="Asia/Tokyo", name="open_time")
+        df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+
+        result = ensure_open_time_as_index(df)
+
+        assert result.index.tz == timezone.utc
+        assert result.index[0] == index[0]
@@ -7,6 +7,9 @@ per-call dict creation and O(n) enum scans.
 import timeit
 from unittest.mock import patch
 
+import attrs
+import pytest
+
 from ckvd.utils.for_core.rest_client_utils import (
     _INTERVAL_BY_VALUE,
     _INTERVAL_MS,
@@ -231,3 +234,118 @@ class TestIntervalSupportedFrozenset:
         is_interval_supported(MarketType.SPOT, Interval.HOUR_1)
         assert MarketType.SPOT in _SUPPORTED_INTERVALS_CACHE
         assert isinstance(_SUPPORTED_INTERVALS_CACHE[MarketType.SPOT], frozenset)
+
+
+class TestMinimumIntervalCache:
+    """Verify get_minimum_interval memoizes per market type."""
+
+    def test_minimum_interval_correctness(self):
+        """Cached result must match the smallest supported interval."""
+        from ckvd.utils.market.enums import MarketType
+        from ckvd.utils.market.validation import get_minimum_interval
+
+        assert get_minimum_interval(MarketType.SPOT) is Interval.SECOND_1
+        assert get_minimum_interval(MarketType.FUTURES_USDT) is Interval.MINUTE_1
+        assert get_minimum_interval(MarketType.FUTURES_COIN) is Interval.MINUTE_1
+
+    def test_minimum_interval_cache_populated(self):
+        """Repeat calls are served from the cache without re-reading capabilities."""
+        from ckvd.utils.market.enums import MarketType
+        from ckvd.utils.market.validation import _MINIMUM_INTERVAL_CACHE, get_minimum_interval
+
+        get_minimum_interval(MarketType.SPOT)
+        assert _MINIMUM_INTERVAL_CACHE[MarketType.SPOT] is Interval.SECOND_1
+
+        with patch("ckvd.utils.market.validation.get_market_capabilities") as mock_caps:
+            assert get_minimum_interval(MarketType.SPOT) is Interval.SECOND_1
+        mock_caps.assert_not_called()
+
+
+class TestMarketCapabilitiesFrozen:
+    """MarketCapabilities are shared constants and must not be reassigned."""
+
+    def test_capabilities_reject_attribute_assignment(self):
+        """Reassigning a field on a shared capabilities entry raises."""
+        from ckvd.utils.market.capabilities import MARKET_CAPABILITIES
+        from ckvd.utils.market.enums import MarketType
+
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            MARKET_CAPABILITIES[MarketType.SPOT].max_limit = 1
+
+    def test_backup_endpoints_are_tuples(self):
+        """Backup endpoint sequences are immutable and shared between USDT futures entries."""
+        from ckvd.utils.market.capabilities import MARKET_CAPABILITIES, OKX_MARKET_CAPABILITIES
+        from ckvd.utils.market.enums import MarketType
+
+        for caps in (*MARKET_CAPABILITIES.values(), *OKX_MARKET_CAPABILITIES.values()):
+            assert isinstance(caps.backup_endpoints, tuple)
+        assert MARKET_CAPABILITIES[MarketType.FUTURES].backup_endpoints is MARKET_CAPABILITIES[MarketType.FUTURES_USDT].backup_endpoints
+
+
+class TestFromStringAliasTables:
+    """from_string parsers read module-level alias tables."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("SPOT", "SPOT"), ("um", "FUTURES_USDT"), ("CM", "FUTURES_COIN"), ("eapi", "OPTIONS"), ("futures", "FUTURES")],
+    )
+    def test_market_type_aliases(self, text, expected):
+        """Aliases resolve case-insensitively to the same members as before."""
+        from ckvd.utils.market.enums import MarketType
+
+        assert MarketType.from_string(text) is MarketType[expected]
+
+    def test_unknown_strings_raise_value_error(self):
+        """Unknown inputs still raise ValueError for every parser."""
+        from ckvd.utils.market.enums import ChartType, DataProvider, MarketType
+
+        for parser in (MarketType.from_string, DataProvider.from_string, ChartType.from_string):
+            with pytest.raises(ValueError, match="Unknown"):
+                parser("nope")
+
+    def test_provider_and_chart_aliases(self):
+        """Provider and chart type aliases resolve case-insensitively."""
+        from ckvd.utils.market.enums import ChartType, DataProvider
+
+        assert DataProvider.from_string("OKX") is DataProvider.OKX
+        assert ChartType.from_string("fundingRate") is ChartType.FUNDING_RATE
+        assert ChartType.from_string("history-candles") is ChartType.OKX_HISTORY_CANDLES
+
+
+class TestMarketTypePropertyTables:
+    """MarketType properties read name-keyed module tables."""
+
+    def test_vision_api_paths_and_futures_flags(self):
+        """Every member keeps its Vision path and futures classification."""
+        from ckvd.utils.market.enums import MarketType
+
+        expected = {
+            MarketType.SPOT: ("spot", False),
+            MarketType.FUTURES_USDT: ("futures/um", True),
+            MarketType.FUTURES_COIN: ("futures/cm", True),
+            MarketType.FUTURES: ("futures/um", True),
+            MarketType.OPTIONS: ("options", False),
+        }
+        assert {mt: (mt.vision_api_path, mt.is_futures) for mt in MarketType} == expected
+
+
+class TestCapabilityIntervalTuples:
+    """Supported intervals are shared immutable tuples."""
+
+    def test_futures_entries_share_one_interval_tuple(self):
+        """Binance futures capabilities reference a single immutable interval tuple."""
+        from ckvd.utils.market.capabilities import MARKET_CAPABILITIES
+        from ckvd.utils.market.enums import MarketType
+
+        futures = [MARKET_CAPABILITIES[mt].supported_intervals for mt in (MarketType.FUTURES_USDT, MarketType.FUTURES_COIN, MarketType.FUTURES)]
+        assert isinstance(futures[0], tuple)
+        assert all(intervals is futures[0] for intervals in futures)
+        assert Interval.SECOND_1 not in futures[0]
+
+    def test_list_intervals_converted_to_tuple(self):
+        """Capabilities built with a list still store an immutable tuple."""
+        from ckvd.utils.market.capabilities import MARKET_CAPABILITIES
+        from ckvd.utils.market.enums import MarketType
+
+        custom = attrs.evolve(MARKET_CAPABILITIES[MarketType.SPOT], supported_intervals=[Interval.HOUR_1])
+        assert custom.supported_intervals == (Interval.HOUR_1,)
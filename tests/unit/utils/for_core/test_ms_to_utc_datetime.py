@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Unit tests for the int64-ms → UTC datetime fast path in ckvd_time_range_utils."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ckvd.utils.for_core.ckvd_time_range_utils import _ms_to_utc_datetime
+
+
+class TestMsToUtcDatetime:
+    """_ms_to_utc_datetime must match pd.to_datetime(unit="ms", utc=True)."""
+
+    def test_matches_to_datetime_for_int64(self):
+        values = pd.Series(np.arange(1704067200000, 1704067200000 + 500 * 60_000, 60_000), name="open_time")
+
+        result = _ms_to_utc_datetime(values)
+
+        pd.testing.assert_series_equal(result, pd.to_datetime(values, unit="ms", utc=True))
+        assert str(result.dtype) == "datetime64[ns, UTC]"
+
+    def test_preserves_index(self):
+        values = pd.Series([1704067200000, 1704067260000], index=[10, 20], name="close_time")
+
+        result = _ms_to_utc_datetime(values)
+
+        assert list(result.index) == [10, 20]
+        assert result.name == "close_time"
+
+    def test_float_with_nan_falls_back(self):
+        values = pd.Series([1704067200000.0, np.nan])
+
+        result = _ms_to_utc_datetime(values)
+
+        assert result.iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+        assert pd.isna(result.iloc[1])
+
+    def test_nullable_int_with_na_falls_back(self):
+        values = pd.Series([1_700_000_000_000, pd.NA], dtype="Int64")
+
+        result = _ms_to_utc_datetime(values)
+
+        assert result.iloc[0] == pd.Timestamp(1_700_000_000_000, unit="ms", tz="UTC")
+        assert result.iloc[1] is pd.NaT
+
+    def test_out_of_range_still_raises(self):
+        # Microsecond values misread as milliseconds overflow datetime64[ns]
+        values = pd.Series([1704067200000000], dtype="int64")
+
+        with pytest.raises(pd.errors.OutOfBoundsDatetime):
+            _ms_to_utc_datetime(values)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Unit tests for ApiBoundaryValidator response parsing and boundary caching."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import orjson
+import pandas as pd
+import pytest
+
+from ckvd.utils import api_boundary_validator
+from ckvd.utils.api_boundary_validator import (
+    ApiBoundaryValidator,
+    _parse_api_response_boundaries,
+    _scan_api_response_boundaries,
+)
+from ckvd.utils.market_constraints import Interval
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def _kline_row(open_ms: int) -> list:
+    """Build a Binance-shaped kline row."""
+    return [open_ms, "42000.01", "42100.00", "41900.00", "42050.00", "12.5", open_ms + 59_999, "525000.0", 100, "6.2", "260000.0", "0"]
+
+
+def test_scan_matches_full_parse():
+    """Bytes scan returns the same boundaries as decoding the full body."""
+    rows = [_kline_row(1704067200000 + i * 60_000) for i in range(1000)]
+    raw = orjson.dumps(rows)
+
+    assert _scan_api_response_boundaries(raw, START, END) == _parse_api_response_boundaries(rows, START, END)
+
+
+def test_scan_single_row_and_whitespace():
+    """Single-row and pretty-printed bodies are handled."""
+    rows = [_kline_row(1704067200000)]
+    raw = orjson.dumps(rows, option=orjson.OPT_INDENT_2)
+
+    result = _scan_api_response_boundaries(raw, START, END)
+    assert result == _parse_api_response_boundaries(rows, START, END)
+    assert result["record_count"] == 1
+
+
+def test_scan_empty_body():
+    """An empty array yields the empty-boundary result."""
+    result = _scan_api_response_boundaries(b"[]", START, END)
+    assert result["record_count"] == 0
+    assert result["api_start_time"] is None
+
+
+def test_scan_unexpected_body_falls_back():
+    """Non-array bodies return None so callers decode the full response."""
+    assert _scan_api_response_boundaries(b'{"code":-1121,"msg":"Invalid symbol."}', START, END) is None
+    assert _scan_api_response_boundaries(b'[["bad",1]]', START, END) is None
+
+
+def _kline_handler(requests_seen: list):
+    """MockTransport handler returning three 1m klines from the requested startTime."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        start_ms = int(request.url.params["startTime"])
+        rows = [_kline_row(start_ms + i * 60_000) for i in range(3)]
+        return httpx.Response(200, content=orjson.dumps(rows), headers={"content-type": "application/json"})
+
+    return handler
+
+
+@pytest.fixture
+def requests_seen():
+    """Requests that reached the mock transport."""
+    return []
+
+
+@pytest.fixture
+def validator(requests_seen):
+    """ApiBoundaryValidator whose sync client is backed by a MockTransport."""
+    v = ApiBoundaryValidator()
+    v.http_client.close()
+    v.http_client = httpx.Client(transport=httpx.MockTransport(_kline_handler(requests_seen)))
+    yield v
+    v.http_client.close()
+
+
+async def test_boundaries_fetched_through_client(validator, requests_seen):
+    """The request goes through the client and the raw body is scanned for boundaries."""
+    end = START + timedelta(minutes=3)
+    result = await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+
+    assert result["record_count"] == 3
+    assert result["api_start_time"] == START
+    assert result["api_end_time"] == START + timedelta(minutes=2)
+    assert "error" not in result
+    (request,) = requests_seen
+    assert request.url.path == "/api/v3/klines"
+    assert request.url.params["symbol"] == "BTCUSDT"
+    assert request.url.params["interval"] == "1m"
+
+
+async def test_boundaries_cached_for_closed_range(validator, requests_seen):
+    """Repeat lookups of a past range reuse the first API response."""
+    end = START + timedelta(minutes=3)
+    first = await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+    second = await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+
+    assert first == second
+    assert len(requests_seen) == 1
+
+
+async def test_boundaries_not_cached_for_open_range(validator, requests_seen):
+    """Ranges ending in the future are always re-fetched."""
+    end = datetime.now(timezone.utc) + timedelta(hours=1)
+    await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+    await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+
+    assert len(requests_seen) == 2
+
+
+async def test_boundary_cache_evicts_oldest_entry(validator, requests_seen, monkeypatch):
+    """At BOUNDARY_CACHE_MAX_ENTRIES the oldest closed range is dropped first."""
+    monkeypatch.setattr(api_boundary_validator, "BOUNDARY_CACHE_MAX_ENTRIES", 2)
+    starts = [START + timedelta(hours=h) for h in range(3)]
+    for start in starts:
+        await validator.get_api_boundaries(start, start + timedelta(minutes=3), Interval.MINUTE_1)
+    assert len(validator._boundary_cache) == 2
+
+    # Newest two are still cached, the first range was evicted and is re-fetched
+    for start in starts[1:]:
+        await validator.get_api_boundaries(start, start + timedelta(minutes=3), Interval.MINUTE_1)
+    assert len(requests_seen) == 3
+    await validator.get_api_boundaries(starts[0], starts[0] + timedelta(minutes=3), Interval.MINUTE_1)
+    assert len(requests_seen) == 4
+
+
+async def test_data_range_match_reuses_cached_boundaries(validator, requests_seen):
+    """does_data_range_match_api_response makes no new request after a lookup."""
+    end = START + timedelta(minutes=3)
+    await validator.get_api_boundaries(START, end, Interval.MINUTE_1)
+
+    index = pd.date_range(START, periods=3, freq="1min", name="open_time")
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+
+    assert await validator.does_data_range_match_api_response(df, START, end, Interval.MINUTE_1)
+    assert len(requests_seen) == 1
+
+
+async def test_close_releases_client():
+    """close() and async-with exit shut the underlying sync client."""
+    async with ApiBoundaryValidator() as v:
+        client = v.http_client
+    assert client.is_closed
+
+
+def test_call_api_sync_uses_klines_endpoint(monkeypatch):
+    """The sync fallback requests the market's klines URL, not a symbol-versioned path."""
+    import requests
+
+    calls = []
+
+    class _Response:
+        status_code = 200
+
+        @staticmethod
+        def json():
+            return []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        return _Response()
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    v = ApiBoundaryValidator()
+    try:
+        v._call_api_sync(START, END, Interval.MINUTE_1, symbol="ETHUSDT")
+    finally:
+        v.http_client.close()
+
+    assert calls == ["https://api.binance.com/api/v3/klines"]
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Unit tests for cache validation utilities (ckvd.utils.cache)."""
+
+import hashlib
+import os
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd.utils.cache import ERROR_TYPES, CacheValidator
+from ckvd.utils.validation import PARALLEL_CHECKSUM_PREFIX, calculate_checksum, calculate_checksum_parallel
+
+
+@pytest.mark.parametrize("payload", [b"", b"x", b"kline" * 100_000])
+def test_calculate_checksum_matches_sha256(tmp_path, payload):
+    """Checksum equals hashlib.sha256 over the file bytes, including empty files."""
+    path = tmp_path / "data.arrow"
+    path.write_bytes(payload)
+
+    expected = hashlib.sha256(payload).hexdigest()
+    assert calculate_checksum(path) == expected
+    assert CacheValidator.calculate_checksum(path) == expected
+
+
+def test_validate_cache_checksum(tmp_path):
+    """validate_cache_checksum compares against the stored digest."""
+    path = tmp_path / "data.arrow"
+    path.write_bytes(b"cached klines")
+    stored = hashlib.sha256(b"cached klines").hexdigest()
+
+    assert CacheValidator.validate_cache_checksum(path, stored) is True
+    assert CacheValidator.validate_cache_checksum(path, "0" * 64) is False
+    assert CacheValidator.validate_cache_checksum(tmp_path / "missing.arrow", stored) is False
+
+
+async def test_validate_cache_checksum_async(tmp_path):
+    """Async variant returns the same result as the sync check."""
+    path = tmp_path / "data.arrow"
+    path.write_bytes(b"cached klines")
+    stored = hashlib.sha256(b"cached klines").hexdigest()
+
+    assert await CacheValidator.validate_cache_checksum_async(path, stored) is True
+    assert await CacheValidator.validate_cache_checksum_async(path, "0" * 64) is False
+
+
+async def test_safely_read_arrow_file_async_sets_utc_index(tmp_path):
+    """Cached Arrow files load with open_time as a UTC DatetimeIndex."""
+    path = tmp_path / "klines.arrow"
+    open_time = pd.date_range("2024-01-01", periods=3, freq="1h", tz="UTC")
+    pl.DataFrame({"open_time": open_time, "close": [1.0, 2.0, 3.0], "volume": [4.0, 5.0, 6.0]}).write_ipc(path)
+
+    df = await CacheValidator.safely_read_arrow_file_async(path)
+
+    assert df.index.name == "open_time"
+    assert str(df.index.tz) == "UTC"
+    assert list(df.index) == list(open_time)
+    assert list(df.columns) == ["close", "volume"]
+    assert df["close"].tolist() == [1.0, 2.0, 3.0]
+
+
+async def test_safely_read_arrow_file_async_column_projection(tmp_path):
+    """Requested columns are read along with open_time."""
+    path = tmp_path / "klines.arrow"
+    open_time = pd.date_range("2024-01-01", periods=2, freq="1h", tz="UTC")
+    pl.DataFrame({"open_time": open_time, "close": [1.0, 2.0], "volume": [4.0, 5.0]}).write_ipc(path)
+
+    df = await CacheValidator.safely_read_arrow_file_async(path, ["volume"])
+
+    assert list(df.columns) == ["volume"]
+    assert df.index.name == "open_time"
+
+
+async def test_safely_read_arrow_file_async_missing_file(tmp_path):
+    """Unreadable files return None instead of raising."""
+    assert await CacheValidator.safely_read_arrow_file_async(tmp_path / "missing.arrow") is None
+
+
+class TestValidateCacheIntegrity:
+    """CacheValidator.validate_cache_integrity existence/size/age checks."""
+
+    def test_missing_file(self, tmp_path):
+        error = CacheValidator.validate_cache_integrity(tmp_path / "missing.arrow")
+
+        assert error.error_type == ERROR_TYPES["FILE_SYSTEM"]
+        assert error.message == "Cache file does not exist"
+        assert error.is_recoverable is True
+        # The immutable missing-file result is shared rather than rebuilt
+        assert CacheValidator.validate_cache_integrity(tmp_path / "other.arrow") is error
+
+    def test_too_small(self, tmp_path):
+        path = tmp_path / "small.arrow"
+        path.write_bytes(b"x" * 10)
+
+        error = CacheValidator.validate_cache_integrity(path)
+
+        assert error.error_type == ERROR_TYPES["DATA_INTEGRITY"]
+        assert "10 bytes" in error.message
+
+    def test_too_old(self, tmp_path):
+        path = tmp_path / "old.arrow"
+        path.write_bytes(b"x" * 2048)
+        old = time.time() - timedelta(days=45).total_seconds()
+        os.utime(path, (old, old))
+
+        error = CacheValidator.validate_cache_integrity(path)
+
+        assert error.error_type == ERROR_TYPES["CACHE_INVALID"]
+        assert error.message.startswith("Cache too old: 45")
+
+    def test_valid(self, tmp_path):
+        path = tmp_path / "ok.arrow"
+        path.write_bytes(b"x" * 2048)
+
+        assert CacheValidator.validate_cache_integrity(path) is None
+
+    def test_reuses_stat_result(self, tmp_path):
+        path = tmp_path / "ok.arrow"
+        path.write_bytes(b"x" * 2048)
+        stats = path.stat()
+        path.unlink()
+
+        # The supplied stat is trusted, so no new syscall sees the deleted file
+        assert CacheValidator.validate_cache_integrity(path, stat_result=stats) is None
+
+
+def test_dataframe_validator_cache_integrity(tmp_path):
+    """DataFrameValidator.validate_cache_integrity reports missing/small/old files."""
+    from ckvd.utils.validation import DataFrameValidator
+
+    path = tmp_path / "data.arrow"
+    assert DataFrameValidator.validate_cache_integrity(str(path))["error_type"] == "file_missing"
+
+    path.write_bytes(b"x" * 10)
+    assert DataFrameValidator.validate_cache_integrity(str(path), min_size=100)["error_type"] == "file_too_small"
+
+    old = time.time() - timedelta(days=3).total_seconds()
+    os.utime(path, (old, old))
+    error = DataFrameValidator.validate_cache_integrity(str(path), min_size=1, max_age=timedelta(days=1))
+    assert error["error_type"] == "file_too_old"
+    assert error["message"] == "File too old: 3 days"
+
+    assert DataFrameValidator.validate_cache_integrity(str(path), min_size=1, max_age=timedelta(days=5)) is None
+
+
+class TestParallelChecksum:
+    """Chunked checksum format (PARALLEL_CHECKSUM_PREFIX)."""
+
+    def test_matches_merkle_definition(self, tmp_path):
+        chunk = 16 * 1024 * 1024
+        payload = b"a" * chunk + b"b" * 1000
+        path = tmp_path / "big.arrow"
+        path.write_bytes(payload)
+
+        digests = hashlib.sha256(payload[:chunk]).digest() + hashlib.sha256(payload[chunk:]).digest()
+        expected = PARALLEL_CHECKSUM_PREFIX + hashlib.sha256(digests).hexdigest()
+
+        assert calculate_checksum_parallel(path) == expected
+        assert calculate_checksum_parallel(path, max_workers=1) == expected
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.arrow"
+        path.write_bytes(b"")
+
+        assert calculate_checksum_parallel(path) == PARALLEL_CHECKSUM_PREFIX + hashlib.sha256(b"").hexdigest()
+
+    def test_validate_accepts_both_formats(self, tmp_path):
+        path = tmp_path / "data.arrow"
+        path.write_bytes(b"cached klines" * 1000)
+
+        assert CacheValidator.validate_cache_checksum(path, calculate_checksum(path))
+        assert CacheValidator.validate_cache_checksum(path, calculate_checksum_parallel(path))
+        assert not CacheValidator.validate_cache_checksum(path, PARALLEL_CHECKSUM_PREFIX + "0" * 64)
+
+    def test_small_cache_files_keep_plain_sha256(self, tmp_path):
+        path = tmp_path / "data.arrow"
+        path.write_bytes(b"cached klines")
+
+        assert CacheValidator.calculate_cache_checksum(path) == calculate_checksum(path)
+
+
+class TestChecksumMemo:
+    """validate_cache_checksum skips re-hashing unchanged files."""
+
+    @pytest.fixture
+    def hash_calls(self, monkeypatch):
+        calls = []
+
+        def counting_checksum(file_path):
+            calls.append(file_path)
+            return calculate_checksum(file_path)
+
+        monkeypatch.setattr(CacheValidator, "calculate_checksum", staticmethod(counting_checksum))
+        return calls
+
+    def test_unchanged_file_hashed_once(self, tmp_path, hash_calls):
+        path = tmp_path / "memo.arrow"
+        path.write_bytes(b"cached klines")
+        stored = hashlib.sha256(b"cached klines").hexdigest()
+
+        assert CacheValidator.validate_cache_checksum(path, stored)
+        assert CacheValidator.validate_cache_checksum(path, stored)
+        assert not CacheValidator.validate_cache_checksum(path, "0" * 64)
+        assert len(hash_calls) == 1
+
+    def test_rewrite_invalidates(self, tmp_path, hash_calls):
+        path = tmp_path / "memo.arrow"
+        path.write_bytes(b"old klines")
+        assert CacheValidator.validate_cache_checksum(path, hashlib.sha256(b"old klines").hexdigest())
+
+        path.write_bytes(b"new klines!")
+
+        assert CacheValidator.validate_cache_checksum(path, hashlib.sha256(b"new klines!").hexdigest())
+        assert len(hash_calls) == 2
+
+    def test_new_process_rehashes_and_detects_corruption(self, tmp_path, hash_calls, monkeypatch):
+        from ckvd.utils.cache import validator as validator_module
+
+        path = tmp_path / "rotted.arrow"
+        path.write_bytes(b"cached klines")
+        stat = os.stat(path)
+        stored = hashlib.sha256(b"cached klines").hexdigest()
+        assert CacheValidator.validate_cache_checksum(path, stored)
+
+        # In-place damage that keeps size and mtime, seen by a fresh process
+        path.write_bytes(b"cached klineZ")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        monkeypatch.setattr(validator_module, "_CHECKSUM_CACHE", {})
+
+        assert not CacheValidator.validate_cache_checksum(path, stored)
+        assert len(hash_calls) == 2
+
+    def test_validation_writes_nothing_to_disk(self, tmp_path):
+        path = tmp_path / "readonly.arrow"
+        path.write_bytes(b"cached klines")
+
+        assert CacheValidator.validate_cache_checksum(path, hashlib.sha256(b"cached klines").hexdigest())
+
+        assert [p.name for p in tmp_path.iterdir()] == ["readonly.arrow"]
+        if hasattr(os, "listxattr"):
+            assert os.listxattr(path) == []
+
+    def test_save_seeds_memo(self, tmp_path, hash_calls):
+        path = tmp_path / "saved.arrow"
+        path.write_bytes(b"cached klines")
+
+        stored = CacheValidator.calculate_cache_checksum(path)
+
+        assert CacheValidator.validate_cache_checksum(path, stored)
+        # Only the save itself hashed the file
+        assert hash_calls == [path]
+
+
+async def test_sync_and_async_arrow_reads_agree(tmp_path):
+    """The sync reader shares the async reader's implementation and result."""
+    path = tmp_path / "klines.arrow"
+    open_time = pd.date_range("2024-01-01", periods=3, freq="1h", tz="UTC")
+    pl.DataFrame({"open_time": open_time, "close": [1.0, 2.0, 3.0]}).write_ipc(path)
+
+    pd.testing.assert_frame_equal(
+        CacheValidator.safely_read_arrow_file(path),
+        await CacheValidator.safely_read_arrow_file_async(path),
+    )
+    assert CacheValidator.safely_read_arrow_file(tmp_path / "missing.arrow") is None
+
+
+async def test_integer_ms_open_time_read_as_epoch_milliseconds(tmp_path):
+    """Integer open_time values are epoch milliseconds, not microseconds."""
+    path = tmp_path / "int_ms.arrow"
+    pl.DataFrame({"open_time": [1704067200000, 1704067260000], "close": [1.0, 2.0]}).write_ipc(path)
+    expected = pd.DatetimeIndex(["2024-01-01 00:00", "2024-01-01 00:01"], tz="UTC")
+
+    for df in (CacheValidator.safely_read_arrow_file(path), await CacheValidator.safely_read_arrow_file_async(path)):
+        assert list(df.index) == list(expected)
+        assert df["close"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.filterwarnings("ignore:Casting from String to DateTime:DeprecationWarning")
+async def test_uncastable_open_time_returns_none(tmp_path):
+    """Polars cast errors are reported as a failed read, not raised."""
+    path = tmp_path / "string_open_time.arrow"
+    pl.DataFrame({"open_time": ["not a time"], "close": [1.0]}).write_ipc(path)
+
+    assert CacheValidator.safely_read_arrow_file(path) is None
+    assert await CacheValidator.safely_read_arrow_file_async(path) is None
+
+
+async def test_safe_memory_map_async_read(tmp_path):
+    """SafeMemoryMap.safely_read_arrow_file returns a Polars frame off the loop."""
+    from ckvd.utils.cache.memory_map import SafeMemoryMap
+
+    path = tmp_path / "klines.arrow"
+    pl.DataFrame({"open_time": pd.date_range("2024-01-01", periods=2, freq="1h", tz="UTC"), "close": [1.0, 2.0]}).write_ipc(path)
+
+    df = await SafeMemoryMap.safely_read_arrow_file(path, ["close"])
+
+    assert df.columns == ["open_time", "close"]
+    assert df["open_time"].dtype.time_zone == "UTC"
+
+
+def test_validate_cache_checksums_batch(tmp_path):
+    """Batch validation reports a per-file result in input order."""
+    good = tmp_path / "good.arrow"
+    bad = tmp_path / "bad.arrow"
+    good.write_bytes(b"good klines")
+    bad.write_bytes(b"bad klines")
+    missing = tmp_path / "missing.arrow"
+    paths_and_sums = {
+        good: hashlib.sha256(b"good klines").hexdigest(),
+        bad: "0" * 64,
+        missing: "0" * 64,
+    }
+
+    results = CacheValidator.validate_cache_checksums(paths_and_sums, max_workers=2)
+
+    assert results == {good: True, bad: False, missing: False}
+    assert list(results) == [good, bad, missing]
+    assert CacheValidator.validate_cache_checksums({good: paths_and_sums[good]}) == {good: True}
+
+
+@pytest.mark.parametrize(
+    ("cache_info", "required_fields", "expected"),
+    [
+        ({"checksum": "x", "record_count": 1, "last_updated": "t"}, None, True),
+        ({"checksum": "x", "record_count": 1}, None, False),
+        ({}, None, False),
+        (None, None, False),
+        ({"checksum": "x"}, ["checksum"], True),
+        ({"checksum": "x"}, ("checksum", "path"), False),
+        ({"checksum": "x"}, [], True),
+    ],
+)
+def test_validate_cache_metadata(cache_info, required_fields, expected):
+    """Metadata is valid only when every required field is present."""
+    assert CacheValidator.validate_cache_metadata(cache_info, required_fields) is expected
+
+
+def test_validate_cache_checksums_only_hashes_unknown_files(tmp_path, monkeypatch):
+    """Files with a known checksum for their fingerprint skip the hash pool."""
+    calls = []
+
+    def counting_checksum(file_path):
+        calls.append(file_path)
+        return calculate_checksum(file_path)
+
+    monkeypatch.setattr(CacheValidator, "calculate_checksum", staticmethod(counting_checksum))
+    known = tmp_path / "known.arrow"
+    fresh = tmp_path / "fresh.arrow"
+    known.write_bytes(b"known klines")
+    fresh.write_bytes(b"fresh klines")
+    assert CacheValidator.validate_cache_checksum(known, hashlib.sha256(b"known klines").hexdigest())
+    calls.clear()
+
+    results = CacheValidator.validate_cache_checksums(
+        {
+            fresh: hashlib.sha256(b"fresh klines").hexdigest(),
+            known: hashlib.sha256(b"known klines").hexdigest(),
+        }
+    )
+
+    assert results == {fresh: True, known: True}
+    assert list(results) == [fresh, known]
+    assert calls == [fresh]
+
+
+def test_integrity_checks_do_not_import_dataframe_stack(tmp_path):
+    """Integrity/checksum/metadata validation works without loading pandas/pyarrow/polars."""
+    path = tmp_path / "data.arrow"
+    path.write_bytes(b"x" * 2048)
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from ckvd.utils.cache import CacheValidator, validate_cache_metadata\n"
+        f"path = Path({str(path)!r})\n"
+        "assert CacheValidator.validate_cache_integrity(path) is None\n"
+        "CacheValidator.validate_cache_checksum(path, '0' * 64)\n"
+        "validate_cache_metadata({'checksum': 'x'})\n"
+        "print(sorted(m for m in ('pandas', 'pyarrow', 'polars') if m in sys.modules))\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
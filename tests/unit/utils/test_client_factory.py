@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Unit tests for HTTP client helpers in ckvd.utils.network.client_factory."""
+
+from unittest.mock import MagicMock
+
+from ckvd.utils.network.client_factory import create_client, safely_close_client
+
+
+def test_safely_close_client_closes_httpx_client():
+    """A real httpx client ends up closed."""
+    client = create_client(timeout=1.0)
+
+    safely_close_client(client)
+
+    assert client.is_closed
+
+
+def test_safely_close_client_ignores_missing_or_non_callable_close():
+    """None and objects without a callable close() are skipped silently."""
+    safely_close_client(None)
+    safely_close_client(object())
+
+    class NotCallable:
+        close = "closed"
+
+    safely_close_client(NotCallable())
+
+
+def test_safely_close_client_swallows_os_error():
+    """OSError raised while closing is logged, not propagated."""
+    client = MagicMock()
+    client.close.side_effect = OSError("socket gone")
+
+    safely_close_client(client)
+
+    client.close.assert_called_once_with()
+
+
+def test_safely_close_client_duck_typed_client():
+    """Non-httpx clients with a sync close() are still closed."""
+    client = MagicMock(spec=["close"])
+
+    safely_close_client(client)
+
+    client.close.assert_called_once_with()
+
+
+def test_default_headers_not_shared_between_clients():
+    """Clients built with default headers get independent header state."""
+    first = create_client(timeout=1.0)
+    second = create_client(timeout=1.0)
+    try:
+        first.headers["X-Test"] = "1"
+
+        assert "X-Test" not in second.headers
+        assert second.headers["Accept"] == "application/json"
+    finally:
+        safely_close_client(first)
+        safely_close_client(second)
+
+
+def test_pooled_connections_kept_alive_between_requests():
+    """Idle pooled connections use the configured keepalive expiry."""
+    from ckvd.utils.config import HTTP_KEEPALIVE_EXPIRY_SECONDS
+
+    client = create_client(timeout=1.0)
+    try:
+        assert client._transport._pool._keepalive_expiry == HTTP_KEEPALIVE_EXPIRY_SECONDS
+    finally:
+        safely_close_client(client)
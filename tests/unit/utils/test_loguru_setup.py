@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Unit tests for the CKVDLogger wrapper in ckvd.utils.loguru_setup."""
+
+import contextlib
+import io
+import types
+
+import pytest
+from loguru import logger as loguru_logger
+
+from ckvd.utils.loguru_setup import logger
+
+
+@pytest.fixture
+def records():
+    """Capture records reaching loguru at DEBUG and restore the CKVD level afterwards."""
+    previous = logger.getEffectiveLevel()
+    # Reconfiguring replaces all handlers, so set the level before adding the sink
+    logger.configure_level("DEBUG")
+    captured = []
+    sink_id = loguru_logger.add(captured.append, level="DEBUG", format="{message}")
+    yield captured
+    loguru_logger.remove(sink_id)
+    logger.configure_level(previous)
+
+
+def test_level_methods_report_calling_site(records):
+    """Records are attributed to the caller, not to the wrapper."""
+    logger.info("from test")
+
+    record = records[-1].record
+    assert record["name"] == __name__
+    assert record["function"] == "test_level_methods_report_calling_site"
+
+
+def test_sinks_added_after_import_receive_records(records):
+    """The shared caller view follows handlers added after it was built."""
+    logger.debug("late sink")
+
+    assert records[-1].record["message"] == "late sink"
+
+
+@pytest.mark.parametrize(
+    ("level", "expected"),
+    [("DEBUG", False), ("warning", True), (10, False), (40, True), (35, False)],
+)
+def test_is_enabled_for_against_warning(level, expected):
+    """isEnabledFor accepts names in any case and stdlib level numbers."""
+    previous = logger.getEffectiveLevel()
+    logger.setLevel(30)
+    try:
+        assert logger.isEnabledFor(level) is expected
+    finally:
+        logger.configure_level(previous)
+
+
+def test_unchanged_configuration_keeps_sinks(records):
+    """Re-applying the current level leaves existing sinks in place."""
+    logger.configure_level("DEBUG")
+
+    logger.debug("still captured")
+
+    assert records[-1].record["message"] == "still captured"
+
+
+def test_unchanged_configuration_restores_removed_sinks(capsys):
+    """Re-applying the level after loguru.logger.remove() reinstalls CKVD's sink."""
+    previous = logger.getEffectiveLevel()
+    logger.configure_level("INFO")
+    loguru_logger.remove()
+    try:
+        logger.configure_level("INFO")
+        logger.info("after external remove")
+    finally:
+        logger.configure_level(previous)
+
+    assert "after external remove" in capsys.readouterr().err
+
+
+def test_redirected_stderr_gets_new_sink():
+    """A replaced sys.stderr is picked up even when the level is unchanged."""
+    previous = logger.getEffectiveLevel()
+    logger.configure_level("INFO")
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(buffer):
+            logger.configure_level("INFO")
+            logger.info("to redirected stderr")
+    finally:
+        logger.configure_level(previous)
+
+    assert "to redirected stderr" in buffer.getvalue()
+
+
+def test_filtered_levels_skip_loguru(monkeypatch):
+    """Calls below every sink's level return before reaching loguru."""
+    from ckvd.utils import loguru_setup
+
+    previous = logger.getEffectiveLevel()
+    logger.configure_level("WARNING")
+    calls = []
+    monkeypatch.setattr(loguru_setup._caller_logger, "debug", lambda *a, **kw: calls.append(a))
+    try:
+        assert logger.debug("dropped") is logger
+    finally:
+        logger.configure_level(previous)
+
+    assert calls == []
+
+
+def test_directly_added_sink_lowers_gate():
+    """A loguru sink added outside CKVDLogger still receives lower-level records."""
+    previous = logger.getEffectiveLevel()
+    logger.configure_level("ERROR")
+    captured = []
+    sink_id = loguru_logger.add(captured.append, level="DEBUG", format="{message}")
+    try:
+        logger.debug("reaches external sink")
+    finally:
+        loguru_logger.remove(sink_id)
+        logger.configure_level(previous)
+
+    assert [m.record["message"] for m in captured] == ["reaches external sink"]
+
+
+def test_gate_uses_loguru_core_min_level():
+    """The level gate reads min_level from loguru's core when it exists."""
+    from ckvd.utils import loguru_setup
+
+    assert loguru_setup._resolve_level_gate(loguru_logger) is loguru_logger._core
+
+
+@pytest.mark.parametrize("fake_logger", [object(), types.SimpleNamespace(_core=object())])
+def test_missing_min_level_disables_gate(fake_logger, records, monkeypatch):
+    """Without loguru's private min_level, every call is passed to loguru."""
+    from ckvd.utils import loguru_setup
+
+    gate = loguru_setup._resolve_level_gate(fake_logger)
+    monkeypatch.setattr(loguru_setup, "_loguru_core", gate)
+
+    logger.debug("ungated")
+
+    assert gate.min_level == 0
+    assert records[-1].record["message"] == "ungated"
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Unit tests for enforce_utc_timezone in ckvd.utils.time.conversion."""
+
+from datetime import datetime, timedelta, timezone
+
+from ckvd.utils.time.conversion import enforce_utc_timezone
+
+
+def test_utc_input_returned_unchanged():
+    """A datetime already in timezone.utc is returned as the same object."""
+    dt = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert enforce_utc_timezone(dt) is dt
+
+
+def test_non_utc_aware_input_converted():
+    """Aware datetimes in other zones are converted to the same instant in UTC."""
+    dt = datetime(2024, 1, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+
+    result = enforce_utc_timezone(dt)
+
+    assert result == datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    assert result.tzinfo is timezone.utc
+
+
+def test_naive_input_assumed_utc():
+    """Naive datetimes keep their wall-clock fields and get timezone.utc attached."""
+    dt = datetime(2024, 1, 1, 12, 30, 15, 500)
+
+    result = enforce_utc_timezone(dt)
+
+    assert result == dt.replace(tzinfo=timezone.utc)
+    assert result.tzinfo is timezone.utc